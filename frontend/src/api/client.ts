@@ -11,7 +11,12 @@ async function request<T>(path: string, init?: RequestInit): Promise<T> {
   });
   if (!res.ok) {
     const body = await res.json().catch(() => ({ detail: res.statusText }));
-    throw new Error(body.detail || `HTTP ${res.status}`);
+    // FastAPI validation errors carry a list of {loc, msg} objects
+    const detail = Array.isArray(body.detail)
+      ? body.detail.map((d: { loc?: unknown[]; msg: string }) =>
+          `${(d.loc ?? []).slice(1).join('.')}: ${d.msg}`).join('; ')
+      : body.detail;
+    throw new Error(detail || `HTTP ${res.status}`);
   }
   return res.json();
 }
@@ -9,6 +9,9 @@ export interface WsMessage {
 
 type MessageHandler = (msg: WsMessage) => void;
 
+// Server broadcasts arrive as binary (UTF-8 JSON) frames
+const decoder = new TextDecoder();
+
 class PriceSocket {
   private ws: WebSocket | null = null;
   private handlers = new Map<string, Set<MessageHandler>>();
@@ -28,6 +31,7 @@ class PriceSocket {
     if (this.ws) return;
     const proto = location.protocol === 'https:' ? 'wss' : 'ws';
     this.ws = new WebSocket(`${proto}://${location.host}/api/ws/prices`);
+    this.ws.binaryType = 'arraybuffer';
 
     this.ws.onopen = () => {
       this._connected = true;
@@ -36,7 +40,8 @@ class PriceSocket {
 
     this.ws.onmessage = (e) => {
       try {
-        const msg: WsMessage = JSON.parse(e.data);
+        const raw = typeof e.data === 'string' ? e.data : decoder.decode(e.data);
+        const msg: WsMessage = JSON.parse(raw);
         const channel = msg.channel;
         this.handlers.get(channel)?.forEach((h) => h(msg));
       } catch {
@@ -58,9 +63,17 @@ class PriceSocket {
 
   disconnect() {
     if (this.reconnectTimer) clearTimeout(this.reconnectTimer);
-    this.ws?.close();
-    this.ws = null;
-    this._connected = false;
+    this.reconnectTimer = null;
+    if (this.ws) {
+      // Deliberate close: skip the auto-reconnect in onclose
+      this.ws.onclose = null;
+      this.ws.close();
+      this.ws = null;
+    }
+    if (this._connected) {
+      this._connected = false;
+      this._onStatusChange?.(false);
+    }
   }
 
   subscribe(channel: string, handler: MessageHandler): () => void {
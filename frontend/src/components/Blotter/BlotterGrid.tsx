@@ -106,10 +106,10 @@ export default function BlotterGrid() {
     loadOrders();
   }, [loadOrders]);
 
-  const columnDefs = useMemo(
-    () => ALL_COLUMNS.filter((c) => visibleColumns.includes(c.field as string)),
-    [visibleColumns],
-  );
+  const columnDefs = useMemo(() => {
+    const visible = new Set(visibleColumns);
+    return ALL_COLUMNS.filter((c) => visible.has(c.field as string));
+  }, [visibleColumns]);
 
   const defaultColDef = useMemo<ColDef>(
     () => ({
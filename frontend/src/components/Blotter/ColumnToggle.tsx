@@ -1,6 +1,6 @@
 import { colors, fonts, fontSizes, spacing, radius } from '../../theme/tokens';
 import { useBlotterStore } from '../../stores/blotterStore';
-import { useState } from 'react';
+import { useMemo, useState } from 'react';
 
 const ALL_COLUMN_IDS = [
   { id: 'id', label: 'ID' },
@@ -23,6 +23,7 @@ const ALL_COLUMN_IDS = [
 
 export default function ColumnToggle() {
   const { visibleColumns, toggleColumn } = useBlotterStore();
+  const visible = useMemo(() => new Set(visibleColumns), [visibleColumns]);
   const [open, setOpen] = useState(false);
 
   return (
@@ -70,7 +71,7 @@ export default function ColumnToggle() {
             >
               <input
                 type="checkbox"
-                checked={visibleColumns.includes(col.id)}
+                checked={visible.has(col.id)}
                 onChange={() => toggleColumn(col.id)}
                 style={{ marginRight: spacing.md }}
               />
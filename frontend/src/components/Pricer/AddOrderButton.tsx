@@ -49,7 +49,7 @@ export default function AddOrderButton() {
       pnl: '',
       multiplier: cs.multiplier,
       _table_data: state.tableData,
-      _underlying: state.underlying,
+      _underlying: state.underlying.trim().toUpperCase(),
       _structure_type: state.structureType,
       _stock_ref: parseFloat(state.stockRef) || undefined,
       _delta: parseFloat(state.delta) || undefined,
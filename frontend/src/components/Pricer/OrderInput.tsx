@@ -2,7 +2,11 @@ import { colors, fonts, fontSizes, spacing, radius } from '../../theme/tokens';
 import { usePricerStore } from '../../stores/pricerStore';
 
 export default function OrderInput() {
-  const { orderText, setOrderText, parseAndPrice, parseError, loading } = usePricerStore();
+  const orderText = usePricerStore((s) => s.orderText);
+  const setOrderText = usePricerStore((s) => s.setOrderText);
+  const parseAndPrice = usePricerStore((s) => s.parseAndPrice);
+  const parseError = usePricerStore((s) => s.parseError);
+  const loading = usePricerStore((s) => s.loading);
 
   const handleKeyDown = (e: React.KeyboardEvent<HTMLTextAreaElement>) => {
     if (e.key === 'Enter' && !e.shiftKey) {
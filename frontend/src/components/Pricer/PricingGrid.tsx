@@ -5,18 +5,19 @@ import 'ag-grid-community/styles/ag-grid.css';
 import 'ag-grid-community/styles/ag-theme-alpine.css';
 
 import { colors } from '../../theme/tokens';
-import { usePricerStore } from '../../stores/pricerStore';
+import { splitTable, usePricerStore } from '../../stores/pricerStore';
 import type { LegRow } from '../../types';
 
 export default function PricingGrid() {
-  const { tableData, tableError, repriceFromTable } = usePricerStore();
+  const tableData = usePricerStore((s) => s.tableData);
+  const tableError = usePricerStore((s) => s.tableError);
+  const repriceFromTable = usePricerStore((s) => s.repriceFromTable);
   const gridRef = useRef<AgGridReact<LegRow>>(null);
 
   // Separate leg rows from structure row
-  const legRows = useMemo(() => tableData.filter((r) => r.leg !== 'Structure'), [tableData]);
-  const structureRow = useMemo(() => {
-    const row = tableData.find((r) => r.leg === 'Structure');
-    return row ? [row] : [];
+  const { legRows, structureRow } = useMemo(() => {
+    const { legRows, structRow } = splitTable(tableData);
+    return { legRows, structureRow: structRow ? [structRow] : [] };
   }, [tableData]);
 
   const staleStyle = { color: colors.textStale, fontStyle: 'italic' as const };
@@ -91,7 +92,7 @@ export default function PricingGrid() {
         if (node.data) rows.push(node.data);
       });
       // Also re-add structure row
-      const structRow = usePricerStore.getState().tableData.find((r) => r.leg === 'Structure');
+      const { structRow } = splitTable(usePricerStore.getState().tableData);
       if (structRow) rows.push(structRow);
       usePricerStore.setState({ tableData: rows });
       repriceFromTable();
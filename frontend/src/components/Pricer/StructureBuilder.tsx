@@ -13,7 +13,11 @@ const btnStyle: React.CSSProperties = {
 };
 
 export default function StructureBuilder() {
-  const { addRow, removeRow, flipStructure, clearAll } = usePricerStore();
+  // Actions never change, so this component doesn't re-render on store updates
+  const addRow = usePricerStore((s) => s.addRow);
+  const removeRow = usePricerStore((s) => s.removeRow);
+  const flipStructure = usePricerStore((s) => s.flipStructure);
+  const clearAll = usePricerStore((s) => s.clearAll);
 
   return (
     <div
@@ -4,7 +4,11 @@ import { useEffect } from 'react';
 import { priceSocket } from '../api/ws';
 import { useBlotterStore } from '../stores/blotterStore';
 import { useConnectionStore } from '../stores/connectionStore';
-import type { BlotterOrder } from '../types';
+import type { BlotterOrder, OrderPatch } from '../types';
+
+// A tab hidden this long drops its socket; the server stops repricing when
+// no one is connected, and full_sync on reconnect restores current state.
+const HIDDEN_DISCONNECT_MS = 60_000;
 
 export function useWebSocket() {
   useEffect(() => {
@@ -13,6 +17,17 @@ export function useWebSocket() {
     });
     priceSocket.connect();
 
+    let hiddenTimer: ReturnType<typeof setTimeout> | undefined;
+    const onVisibilityChange = () => {
+      clearTimeout(hiddenTimer);
+      if (document.hidden) {
+        hiddenTimer = setTimeout(() => priceSocket.disconnect(), HIDDEN_DISCONNECT_MS);
+      } else {
+        priceSocket.connect();
+      }
+    };
+    document.addEventListener('visibilitychange', onVisibilityChange);
+
     const unsubs = [
       // Blotter price updates (every 1s from background broadcaster)
       priceSocket.subscribe('blotter_prices', (msg) => {
@@ -26,14 +41,20 @@ export function useWebSocket() {
         useConnectionStore.getState().setHealth(data.source, data.status);
       }),
 
-      // Cross-tab order sync
+      // Cross-tab order sync: full list on connect, then per-batch patches
       priceSocket.subscribe('order_sync', (msg) => {
-        const data = msg.data as { orders: BlotterOrder[] };
-        useBlotterStore.getState().setOrders(data.orders);
+        if (msg.action === 'full_sync') {
+          const data = msg.data as { orders: BlotterOrder[] };
+          useBlotterStore.getState().setOrders(data.orders);
+        } else {
+          useBlotterStore.getState().applyOrderPatch(msg.data as OrderPatch);
+        }
       }),
     ];
 
     return () => {
+      document.removeEventListener('visibilitychange', onVisibilityChange);
+      clearTimeout(hiddenTimer);
       unsubs.forEach((fn) => fn());
       priceSocket.disconnect();
     };
@@ -2,7 +2,7 @@
 
 import { create } from 'zustand';
 import { persist } from 'zustand/middleware';
-import type { BlotterOrder } from '../types';
+import type { BlotterOrder, OrderPatch } from '../types';
 import * as api from '../api/client';
 
 const DEFAULT_VISIBLE = [
@@ -18,6 +18,7 @@ export interface BlotterState {
   // Actions
   loadOrders: () => Promise<void>;
   setOrders: (orders: BlotterOrder[]) => void;
+  applyOrderPatch: (patch: OrderPatch) => void;
   addOrder: (order: BlotterOrder) => Promise<void>;
   updateOrderField: (id: string, field: string, value: string) => Promise<void>;
   deleteSelected: () => Promise<void>;
@@ -41,6 +42,26 @@ export const useBlotterStore = create<BlotterState>()(
 
       setOrders: (orders) => set({ orders }),
 
+      applyOrderPatch: ({ added, updated, deleted }) => {
+        set((s) => {
+          const gone = new Set(deleted);
+          const changed = new Map<string, BlotterOrder>();
+          for (const o of updated) changed.set(o.id, o);
+          for (const o of added) changed.set(o.id, o);
+          const orders: BlotterOrder[] = [];
+          for (const o of s.orders) {
+            if (gone.has(o.id)) continue;
+            const next = changed.get(o.id);
+            orders.push(next ? { ...o, ...next } : o);
+            changed.delete(o.id);
+          }
+          // Added orders not already merged above (this tab's own adds arrive
+          // via the HTTP response first) are appended
+          for (const o of added) if (changed.has(o.id)) orders.push(o);
+          return { orders };
+        });
+      },
+
       addOrder: async (order) => {
         const res = await api.addOrder(order);
         set({ orders: res.orders });
@@ -58,6 +58,26 @@ function emptyRow(i: number): LegRow {
   };
 }
 
+// Template rows built once at load; applyTemplate hands out copies because
+// AG Grid edits row objects in place.
+const TEMPLATE_ROWS: Record<string, LegRow[]> = Object.fromEntries(
+  Object.entries(STRUCTURE_TEMPLATES).map(([name, template]) => [
+    name,
+    template.map((t, i) => ({ ...emptyRow(i + 1), type: t.type, ratio: t.ratio })),
+  ]),
+);
+
+/**
+ * Split table rows into leg rows and the Structure row.
+ * The Structure row, when present, is always kept last (the API emits it
+ * last and every store action preserves that), so only the tail is checked.
+ */
+export function splitTable(rows: LegRow[]): { legRows: LegRow[]; structRow: LegRow | undefined } {
+  const last = rows[rows.length - 1];
+  if (last?.leg === 'Structure') return { legRows: rows.slice(0, -1), structRow: last };
+  return { legRows: rows, structRow: undefined };
+}
+
 export interface PricerState {
   // Order text
   orderText: string;
@@ -94,6 +114,12 @@ export interface PricerState {
   applyPriceResponse: (res: PriceResponse, parsed?: { underlying: string; structure_name: string; stock_ref: number; delta: number; price: number; quote_side: string; quantity: number }) => void;
 }
 
+// Toolbar fields reprice on blur, so tabbing across several of them would
+// send a request per field; a reprice waits this long and only the latest
+// call goes out. The counter also drops responses that arrive out of order.
+const REPRICE_DEBOUNCE_MS = 250;
+let repriceSeq = 0;
+
 export const usePricerStore = create<PricerState>((set, get) => ({
   orderText: '',
   tableData: [emptyRow(1), emptyRow(2)],
@@ -148,70 +174,80 @@ export const usePricerStore = create<PricerState>((set, get) => ({
   },
 
   repriceFromTable: async () => {
-    const state = get();
-    if (!state.underlying.trim()) return;
+    const seq = ++repriceSeq;
+    await new Promise(resolve => setTimeout(resolve, REPRICE_DEBOUNCE_MS));
+    if (seq !== repriceSeq) return;
 
-    // Build legs from table rows
-    const legRows = state.tableData.filter(r => r.leg.startsWith('Leg'));
-    const legs = [];
-    for (const row of legRows) {
-      const expiry = String(row.expiry).trim();
-      const strike = Number(row.strike);
-      const type = String(row.type).trim();
-      const ratio = Number(row.ratio);
-      if (!expiry || !strike || !type || !ratio) continue;
+    try {
+      const state = get();
+      if (!state.underlying.trim()) return;
 
-      // Convert expiry "Jun26" -> "2026-06-16" (approximate)
-      const monthMap: Record<string, string> = {
-        Jan: '01', Feb: '02', Mar: '03', Apr: '04', May: '05', Jun: '06',
-        Jul: '07', Aug: '08', Sep: '09', Oct: '10', Nov: '11', Dec: '12',
-      };
-      const monthStr = expiry.slice(0, 3);
-      const yearStr = expiry.slice(3);
-      const month = monthMap[monthStr];
-      if (!month || !yearStr) continue;
+      // Build legs from table rows
+      const { legRows } = splitTable(state.tableData);
+      const legs = [];
+      for (const row of legRows) {
+        const expiry = String(row.expiry).trim();
+        const strike = Number(row.strike);
+        const type = String(row.type).trim();
+        const ratio = Number(row.ratio);
+        if (!expiry || !strike || !type || !ratio) continue;
 
-      const year = 2000 + parseInt(yearStr);
-      const expiryDate = `${year}-${month}-16`;
+        // Convert expiry "Jun26" -> "2026-06-16" (approximate)
+        const monthMap: Record<string, string> = {
+          Jan: '01', Feb: '02', Mar: '03', Apr: '04', May: '05', Jun: '06',
+          Jul: '07', Aug: '08', Sep: '09', Oct: '10', Nov: '11', Dec: '12',
+        };
+        const monthStr = expiry.slice(0, 3);
+        const yearStr = expiry.slice(3);
+        const month = monthMap[monthStr];
+        if (!month || !yearStr) continue;
 
-      legs.push({
-        expiry: expiryDate,
-        strike,
-        option_type: type === 'C' ? 'call' : 'put',
-        side: ratio > 0 ? 'buy' : 'sell',
-        quantity: Math.abs(ratio),
-        ratio: Math.abs(ratio),
-      });
-    }
+        const year = 2000 + parseInt(yearStr);
+        const expiryDate = `${year}-${month}-16`;
+
+        legs.push({
+          expiry: expiryDate,
+          strike,
+          option_type: type === 'C' ? 'call' : 'put',
+          side: ratio > 0 ? 'buy' : 'sell',
+          quantity: Math.abs(ratio),
+          ratio: Math.abs(ratio),
+        });
+      }
 
-    if (legs.length === 0) return;
+      if (legs.length === 0) return;
 
-    set({ tableError: '', loading: true });
-    try {
-      const structName = (state.structureType || 'custom').replace(/_/g, ' ');
-      const res = await api.priceFromTable({
-        underlying: state.underlying.trim().toUpperCase(),
-        structure_name: structName,
-        legs,
-        stock_ref: parseFloat(state.stockRef) || 0,
-        delta: parseFloat(state.delta) || 0,
-        price: parseFloat(state.brokerPrice) || 0,
-        quote_side: state.quoteSide || 'bid',
-        quantity: parseInt(state.quantity) || 1,
-      });
-      set({ loading: false });
-      get().applyPriceResponse(res);
-    } catch (e: unknown) {
-      set({ loading: false, tableError: e instanceof Error ? e.message : String(e) });
+      set({ tableError: '', loading: true });
+      try {
+        const structName = (state.structureType || 'custom').replace(/_/g, ' ');
+        const res = await api.priceFromTable({
+          underlying: state.underlying.trim().toUpperCase(),
+          structure_name: structName,
+          legs,
+          stock_ref: parseFloat(state.stockRef) || 0,
+          delta: parseFloat(state.delta) || 0,
+          price: parseFloat(state.brokerPrice) || 0,
+          quote_side: state.quoteSide || 'bid',
+          quantity: parseInt(state.quantity) || 1,
+        });
+        // A newer reprice superseded this one; only its result is applied
+        if (seq !== repriceSeq) return;
+        get().applyPriceResponse(res);
+      } catch (e: unknown) {
+        if (seq !== repriceSeq) return;
+        set({ tableError: e instanceof Error ? e.message : String(e) });
+      }
+    } finally {
+      // Whichever call is latest clears the flag, even on its early returns,
+      // so a superseded in-flight call can't leave it stuck on
+      if (seq === repriceSeq) set({ loading: false });
     }
   },
 
   applyPriceResponse: (res) => {
-    // Separate structure row (pinned) from leg rows
-    const legRows = res.table_data.filter(r => r.leg !== 'Structure');
-    const structRow = res.table_data.find(r => r.leg === 'Structure');
+    // Rows arrive as legs followed by the (pinned) Structure row
     set({
-      tableData: structRow ? [...legRows, structRow] : legRows,
+      tableData: res.table_data,
       header: res.header,
       brokerQuote: res.broker_quote,
       currentStructure: res.current_structure,
@@ -219,36 +255,30 @@ export const usePricerStore = create<PricerState>((set, get) => ({
   },
 
   applyTemplate: (structureType) => {
-    const template = STRUCTURE_TEMPLATES[structureType];
+    const template = TEMPLATE_ROWS[structureType];
     if (!template) return;
-    const rows = template.map((t, i) => ({
-      ...emptyRow(i + 1),
-      type: t.type,
-      ratio: t.ratio,
-    }));
-    set({ tableData: rows, structureType });
+    set({ tableData: template.map(row => ({ ...row })), structureType });
   },
 
   addRow: () => {
-    const rows = get().tableData.filter(r => r.leg !== 'Structure');
+    const rows = [...splitTable(get().tableData).legRows];
     rows.push(emptyRow(rows.length + 1));
     set({ tableData: rows });
   },
 
   removeRow: () => {
-    const rows = get().tableData.filter(r => r.leg !== 'Structure');
+    const rows = [...splitTable(get().tableData).legRows];
     if (rows.length > 1) rows.pop();
     set({ tableData: rows });
   },
 
   flipStructure: () => {
     const { tableData, delta, underlying } = get();
-    const newRows = tableData.map(row => {
-      if (row.leg.startsWith('Leg') && row.ratio !== '' && row.ratio !== 0) {
-        return { ...row, ratio: -Number(row.ratio) };
-      }
-      return row;
-    });
+    const { legRows, structRow } = splitTable(tableData);
+    const newRows = legRows.map(row => (
+      row.ratio !== '' && row.ratio !== 0 ? { ...row, ratio: -Number(row.ratio) } : row
+    ));
+    if (structRow) newRows.push(structRow);
     const newDelta = delta ? String(-parseFloat(delta)) : '';
     set({ tableData: newRows, delta: newDelta });
     if (underlying.trim()) {
@@ -257,6 +287,8 @@ export const usePricerStore = create<PricerState>((set, get) => ({
   },
 
   clearAll: () => {
+    // Drop any reprice still in flight so it doesn't repopulate the table
+    repriceSeq++;
     set({
       orderText: '',
       tableData: [emptyRow(1), emptyRow(2)],
@@ -272,6 +304,7 @@ export const usePricerStore = create<PricerState>((set, get) => ({
       brokerPrice: '',
       quoteSide: 'bid',
       quantity: '',
+      loading: false,
     });
   },
 
@@ -99,6 +99,13 @@ export interface BlotterOrder {
   _current_structure?: CurrentStructure;
 }
 
+/** Net order changes from one server-side write batch (order_sync channel). */
+export interface OrderPatch {
+  added: BlotterOrder[];
+  updated: BlotterOrder[];
+  deleted: string[];
+}
+
 export interface HealthData {
   source: string;
   status: string;
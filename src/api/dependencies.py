@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
+import orjson
 from fastapi import WebSocket
 
 from options_pricer.bloomberg import (
@@ -12,26 +17,94 @@ from options_pricer.bloomberg import (
     MockBloombergClient,
     create_client,
 )
+from options_pricer.market_cache import CachedMarketClient
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on a single socket send so one slow client cannot stall a
+# broadcast for everyone else.
+_SEND_TIMEOUT = 1.0
+
+# Cap on sends in flight at once, so a large fan-out doesn't issue every
+# socket write in the same loop iteration.
+_MAX_CONCURRENT_SENDS = 100
+
 # ---------------------------------------------------------------------------
 # Bloomberg client singleton
 # ---------------------------------------------------------------------------
 
 _client: BloombergClient | MockBloombergClient | None = None
+# TTL-cached view of _client for on-demand pricing; replaced with the client
+_cached_client: CachedMarketClient | None = None
+
+# Both clients are kept once created, so toggling the data source swaps the
+# active reference instead of tearing down and re-handshaking a blpapi session.
+_bbg_client: BloombergClient | None = None
+_mock_client: MockBloombergClient | None = None
+
+# Worker threads for blocking market-data calls.  Kept small: Bloomberg
+# requests share one session and serialize on its lock.  It is separate from
+# the loop's default executor, so calls queued on that lock never hold up
+# order file I/O (asyncio.to_thread).
+_MARKET_DATA_WORKERS = 8
+_market_data_pool: ThreadPoolExecutor | None = None
 
 
 def startup_client() -> None:
-    global _client
-    _client = create_client(use_mock=False)
+    global _bbg_client, _mock_client, _market_data_pool
+    _market_data_pool = ThreadPoolExecutor(
+        max_workers=_MARKET_DATA_WORKERS, thread_name_prefix="mktdata",
+    )
+    client = create_client(use_mock=False)
+    if isinstance(client, BloombergClient):
+        _bbg_client = client
+    else:
+        _mock_client = client
+    set_client(client)
 
 
 def shutdown_client() -> None:
-    global _client
-    if _client is not None:
-        _client.disconnect()
-        _client = None
+    global _client, _cached_client, _bbg_client, _mock_client, _market_data_pool
+    if _bbg_client is not None:
+        _bbg_client.disconnect()
+    if _market_data_pool is not None:
+        _market_data_pool.shutdown(wait=False)
+    _client = _cached_client = _bbg_client = _mock_client = None
+    _market_data_pool = None
+
+
+async def run_market_data(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking market-data call on the market-data thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_market_data_pool, functools.partial(fn, *args))
+
+
+def get_mock_client() -> MockBloombergClient:
+    global _mock_client
+    if _mock_client is None:
+        _mock_client = MockBloombergClient()
+    return _mock_client
+
+
+def get_bloomberg_client() -> BloombergClient | None:
+    """Return a live client, reusing the cached session while it still answers.
+
+    Reconnects only when the cached session is missing or fails a ping.
+    Returns None if Bloomberg cannot be reached.
+    """
+    global _bbg_client
+    if _bbg_client is not None:
+        if _bbg_client.ping():
+            return _bbg_client
+        logger.info("Cached Bloomberg session is stale — reconnecting")
+        _bbg_client.disconnect()
+        _bbg_client = None
+
+    client = BloombergClient()
+    if not client.connect():
+        return None
+    _bbg_client = client
+    return client
 
 
 def get_client() -> BloombergClient | MockBloombergClient:
@@ -40,9 +113,17 @@ def get_client() -> BloombergClient | MockBloombergClient:
     return _client
 
 
+def get_cached_client() -> CachedMarketClient:
+    """Return the active client behind short-lived TTL caches."""
+    if _cached_client is None:
+        raise RuntimeError("Client not initialised — call startup_client() first")
+    return _cached_client
+
+
 def set_client(client: BloombergClient | MockBloombergClient) -> None:
-    global _client
+    global _client, _cached_client
     _client = client
+    _cached_client = CachedMarketClient(client)
 
 
 # ---------------------------------------------------------------------------
@@ -54,24 +135,59 @@ class ConnectionManager:
     """Manages active WebSocket connections for broadcasting price updates."""
 
     def __init__(self) -> None:
-        self.active: list[WebSocket] = []
+        self.active: set[WebSocket] = set()
 
-    async def connect(self, ws: WebSocket) -> None:
-        await ws.accept()
-        self.active.append(ws)
+    def join(self, ws: WebSocket) -> None:
+        """Start broadcasting to *ws*, which the caller has already accepted."""
+        self.active.add(ws)
 
     def disconnect(self, ws: WebSocket) -> None:
-        if ws in self.active:
-            self.active.remove(ws)
-
-    async def broadcast(self, message: dict) -> None:
-        data = json.dumps(message, default=str)
-        for ws in self.active[:]:
-            try:
-                await ws.send_text(data)
-            except Exception:
-                logger.debug("Removing dead WebSocket connection")
-                self.active.remove(ws)
+        self.active.discard(ws)
+
+    async def drop(self, ws: WebSocket) -> None:
+        """Forget *ws* and close it so the client notices and reconnects.
+
+        Only removing it would leave the socket open with nothing being sent
+        to it, and the client would never fetch a fresh ``full_sync``.
+        """
+        self.active.discard(ws)
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(ws.close(code=1011), _SEND_TIMEOUT)
+
+    async def broadcast(self, message: dict | None, precomputed: bytes | None = None) -> None:
+        """Send *message* to every connection.
+
+        Callers that already hold the encoded frame pass it as *precomputed*
+        (and ``None`` for *message*) so it is not re-serialized.
+        """
+        if not self.active:
+            return
+        # Encode once with orjson and send as a binary frame — skips the
+        # str -> UTF-8 re-encode that send_text does for every socket.
+        if precomputed is not None:
+            data = precomputed
+        else:
+            data = orjson.dumps(message, default=str, option=orjson.OPT_NON_STR_KEYS)
+        for ws in await self.send_each([(ws, data) for ws in self.active]):
+            logger.debug("Removing dead WebSocket connection")
+            await self.drop(ws)
+
+    async def send_each(self, frames: list[tuple[WebSocket, bytes]]) -> list[WebSocket]:
+        """Send each ``(ws, data)`` pair concurrently; return the sockets that failed."""
+        sem = asyncio.Semaphore(_MAX_CONCURRENT_SENDS)
+
+        async def send(ws: WebSocket, data: bytes) -> None:
+            async with sem:
+                await asyncio.wait_for(ws.send_bytes(data), _SEND_TIMEOUT)
+
+        results = await asyncio.gather(
+            *(send(ws, data) for ws, data in frames),
+            return_exceptions=True,
+        )
+        return [
+            ws for (ws, _), result in zip(frames, results)
+            if isinstance(result, Exception)
+        ]
 
 
 manager = ConnectionManager()
@@ -1,6 +1,10 @@
 """FastAPI application entry point for the Options Pricer API.
 
 Run with: uvicorn api.main:app --reload --port 8000
+
+uvicorn's default ``--loop auto`` runs on uvloop when it is installed, which
+``uvicorn[standard]`` does on Linux/macOS; the WebSocket fan-out is the main
+beneficiary.  uvloop has no Windows build, so there it is the stock loop.
 """
 
 import asyncio
@@ -13,6 +17,7 @@ from fastapi.responses import JSONResponse
 from starlette.requests import Request
 
 from .dependencies import shutdown_client, startup_client
+from .order_writer import order_writer
 from .routes import orders, parse, price, source
 from .ws import price_broadcast_loop, router as ws_router
 
@@ -21,8 +26,10 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    logger.info("Event loop: %s", type(asyncio.get_running_loop()).__module__)
     startup_client()
-    # Start the background price broadcaster
+    # Start the order mutation writer and the background price broadcaster
+    order_writer.start()
     task = asyncio.create_task(price_broadcast_loop())
     yield
     task.cancel()
@@ -30,6 +37,7 @@ async def lifespan(app: FastAPI):
         await task
     except asyncio.CancelledError:
         pass
+    await order_writer.stop()
     shutdown_client()
 
 
@@ -0,0 +1,281 @@
+"""Coalescing writer for blotter mutations.
+
+Route handlers submit mutations to a single background task instead of each
+doing its own load-modify-save.  The task applies every mutation queued
+within a short window to one in-memory orders list, then saves once and
+broadcasts once — N bursty edits cost one write and one order_sync frame.
+That frame carries only the orders the batch touched; clients get the full
+list once, as a ``full_sync``, when they connect.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable
+
+import orjson
+
+from options_pricer.order_store import get_orders_stamp, load_orders, save_orders_locked
+
+from .dependencies import manager
+
+logger = logging.getLogger(__name__)
+
+_BATCH_WINDOW = 0.02  # seconds to wait for more mutations after the first
+_BATCH_MAX = 64
+
+# A mutation takes the current orders list and returns
+# (new_orders, result, change).  *change* names what it touched, using any of
+# the keys "added" (order dicts), "updated" (order dicts) and "deleted" (IDs).
+# It must validate before mutating: raising leaves the list untouched and
+# the exception is delivered to the submitting handler only.
+Mutation = Callable[[list[dict]], tuple[list[dict], Any, dict[str, list]]]
+
+# Blotter price fields per order ID, set by the price loop.  They are derived
+# from market data and change every tick, so they live in memory only and are
+# layered over the stored orders on read.
+PRICE_FIELDS = ("bid", "mid", "offer", "bid_size", "offer_size", "pnl")
+_live_prices: dict[str, dict] = {}
+_live_version = 0
+
+# Bumped by the writer after each save.  Two same-size saves within one
+# mtime tick leave the file stamp unchanged, so our own writes are tracked
+# here; the stamp only catches writes from outside this process.
+_orders_version = 0
+
+# Encoded {"orders": [...]} body keyed by (orders version, live price
+# version, orders file stamp).  A batch encodes once for its HTTP responses,
+# and GETs reuse the bytes until the orders or the prices change.
+_orders_json_cache: tuple[tuple[int, int, tuple[int, int]], bytes] | None = None
+
+
+def live_price(order_id: str) -> dict | None:
+    """Return the last live price fields for *order_id*, if any."""
+    return _live_prices.get(order_id)
+
+
+def update_live_prices(updates: dict[str, dict]) -> None:
+    global _live_version
+    _live_prices.update(updates)
+    _live_version += 1
+
+
+def prune_live_prices(order_ids: set[str]) -> None:
+    """Forget live prices for orders not in *order_ids*."""
+    for oid in _live_prices.keys() - order_ids:
+        del _live_prices[oid]
+
+
+def _refresh_live_prices(order: dict) -> None:
+    """Adopt an edited order's price fields (e.g. a recalculated PnL)."""
+    prices = _live_prices.get(order.get("id"))
+    if prices is not None:
+        prices.update({f: order.get(f, "") for f in PRICE_FIELDS})
+
+
+def overlay_live_prices(orders: list[dict]) -> list[dict]:
+    """Copy the live price fields onto *orders* in place and return them."""
+    if _live_prices:
+        for order in orders:
+            prices = _live_prices.get(order.get("id"))
+            if prices:
+                order.update(prices)
+    return orders
+
+
+def load_live_orders() -> list[dict]:
+    """Load the stored orders with live prices applied (blocking I/O)."""
+    return overlay_live_prices(load_orders())
+
+
+def orders_version() -> tuple[int, int]:
+    """Return a value that changes on every order save and live price tick."""
+    return (_orders_version, _live_version)
+
+
+def _orders_cache_key() -> tuple[int, int, tuple[int, int]]:
+    return (_orders_version, _live_version, get_orders_stamp())
+
+
+def encode_orders(orders: list[dict], key: tuple[int, int, tuple[int, int]]) -> bytes:
+    """Return the encoded orders body, reusing the cached bytes when current.
+
+    *orders* must already carry live prices (see ``overlay_live_prices``).
+    *key* is the cache key taken before *orders* were read, so a save or
+    price tick that lands in between can't file old orders under a new key.
+    """
+    global _orders_json_cache
+    if _orders_json_cache is not None and _orders_json_cache[0] == key:
+        return _orders_json_cache[1]
+    data = orjson.dumps({"orders": orders}, default=str)
+    _orders_json_cache = (key, data)
+    return data
+
+
+def load_orders_json() -> bytes:
+    """Return the encoded orders body, loading only on a cache miss (blocking I/O)."""
+    key = _orders_cache_key()
+    cached = _orders_json_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    return encode_orders(load_live_orders(), key)
+
+
+def cached_orders_json() -> bytes | None:
+    """Return the cached orders body if nothing has changed since, else None."""
+    cached = _orders_json_cache
+    if cached is not None and cached[0] == _orders_cache_key():
+        return cached[1]
+    return None
+
+
+def order_sync_frame(action: str, data_json: bytes) -> bytes:
+    """Wrap an encoded payload in an order_sync WS message."""
+    return b'{"channel":"order_sync","action":"%s","data":%s}' % (
+        action.encode(), data_json,
+    )
+
+
+class _BatchPatch:
+    """Net effect of a batch, folded so each order ID appears at most once.
+
+    Order dicts are held by reference, so an order added and then edited in
+    the same batch is sent once, in its final state.
+    """
+
+    def __init__(self) -> None:
+        self.added: dict[str, dict] = {}
+        self.updated: dict[str, dict] = {}
+        self.deleted: list[str] = []
+
+    def merge(self, change: dict[str, list]) -> None:
+        for order in change.get("added", ()):
+            self.added[order.get("id")] = order
+        for order in change.get("updated", ()):
+            oid = order.get("id")
+            if oid not in self.added:
+                self.updated[oid] = order
+        for oid in change.get("deleted", ()):
+            if self.added.pop(oid, None) is None:
+                self.updated.pop(oid, None)
+                self.deleted.append(oid)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.deleted)
+
+    def encode(self) -> bytes:
+        return orjson.dumps(
+            {
+                "added": list(self.added.values()),
+                "updated": list(self.updated.values()),
+                "deleted": self.deleted,
+            },
+            default=str,
+        )
+
+
+class OrderWriter:
+    """Single consumer that batches order mutations into one save + broadcast."""
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        # Set after each saved batch; the price loop waits on it to reprice
+        # edited orders without waiting out its tick.
+        self.committed: asyncio.Event | None = None
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self.committed = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._queue = None
+        self.committed = None
+
+    async def submit(self, action: str, mutate: Mutation) -> tuple[Any, bytes]:
+        """Queue a mutation and wait for its batch to be saved.
+
+        Returns ``(result, orders_json)`` where *orders_json* is the encoded
+        orders body after the batch was applied.
+        """
+        if self._queue is None:
+            raise RuntimeError("Order writer not started")
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((action, mutate, fut))
+        return await fut
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + _BATCH_WINDOW
+            while len(batch) < _BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._apply(batch)
+
+    async def _apply(self, batch: list[tuple[str, Mutation, asyncio.Future]]) -> None:
+        global _orders_version
+        applied: list[tuple[asyncio.Future, Any]] = []
+        actions: set[str] = set()
+        patch = _BatchPatch()
+        try:
+            # Disk I/O runs in a worker thread so an fsync doesn't stall the
+            # loop; the writer is the only consumer, so batches never overlap.
+            orders = overlay_live_prices(await asyncio.to_thread(load_orders))
+            for action, mutate, fut in batch:
+                try:
+                    orders, result, change = mutate(orders)
+                except Exception as exc:
+                    fut.set_exception(exc)
+                    continue
+                applied.append((fut, result))
+                patch.merge(change)
+                actions.add(action)
+
+            if not applied:
+                return
+
+            # A batch of no-op edits leaves the file and clients as they are
+            if patch:
+                for order in patch.updated.values():
+                    _refresh_live_prices(order)
+
+                await asyncio.to_thread(save_orders_locked, orders)
+                _orders_version += 1
+                self.committed.set()
+            # Re-apply in case a price tick landed while the save was running
+            key = _orders_cache_key()
+            orders_json = encode_orders(overlay_live_prices(orders), key)
+            action = actions.pop() if len(actions) == 1 else "batch"
+            if patch and manager.active:
+                frame = order_sync_frame(action, patch.encode())
+                await manager.broadcast(None, precomputed=frame)
+        except Exception as exc:
+            logger.exception("Order batch of %d mutation(s) failed", len(batch))
+            for _, _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+
+        for fut, result in applied:
+            if not fut.done():
+                fut.set_result((result, orders_json))
+
+
+order_writer = OrderWriter()
@@ -0,0 +1,47 @@
+"""Response classes for the Options Pricer API."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import ormsgpack
+except ImportError:  # optional: pip install -e ".[msgpack]"
+    ormsgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    For endpoints that return plain dicts (no response_model). Routes with a
+    response_model are left on FastAPI's default class, which serializes the
+    model straight to bytes via Pydantic; a custom default class would
+    disable that path.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+class MsgpackResponse(Response):
+    """MessagePack-encoded response for clients that ask for it."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return ormsgpack.packb(content, default=str, option=ormsgpack.OPT_NON_STR_KEYS)
+
+
+def wants_msgpack(request: Request) -> bool:
+    """True if the client accepts msgpack and ormsgpack is installed."""
+    return ormsgpack is not None and MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
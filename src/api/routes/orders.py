@@ -4,22 +4,27 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
 
-from options_pricer.order_store import (
-    load_orders,
-    orders_to_display,
-    save_orders_locked,
-    update_order,
-)
-
-from ..dependencies import manager
+from ..order_writer import load_live_orders, load_orders_json, order_writer
+from ..responses import MsgpackResponse, OrjsonResponse, wants_msgpack
 from ..schemas import OrderDeleteRequest, OrderUpdateRequest, OrdersResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-_MANUAL_FIELDS = ("side", "size", "traded", "bought_sold", "traded_price", "initiator")
+# These routes return pre-encoded bytes; the model is kept for OpenAPI only
+# so FastAPI never validates or re-serializes the (possibly large) list.
+_ORDERS_DOC = {200: {"model": OrdersResponse}}
+
+_MANUAL_FIELDS = frozenset(
+    {"side", "size", "traded", "bought_sold", "traded_price", "initiator"}
+)
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
 
 
 def _recalc_pnl(order: dict) -> None:
@@ -43,30 +48,27 @@ def _recalc_pnl(order: dict) -> None:
         order["pnl"] = ""
 
 
-@router.get("/orders", response_model=OrdersResponse)
-def get_orders():
+@router.get("/orders", response_model=None, responses=_ORDERS_DOC)
+def get_orders(request: Request):
     """Return all orders (including private recall fields for the frontend)."""
-    orders = load_orders()
-    return OrdersResponse(orders=orders)
+    if wants_msgpack(request):
+        return MsgpackResponse({"orders": load_live_orders()})
+    return _json_response(load_orders_json())
 
 
-@router.post("/orders", response_model=OrdersResponse)
+@router.post("/orders", response_model=None, responses=_ORDERS_DOC)
 async def add_order(body: dict):
     """Add a new order to the blotter and broadcast to all WS clients."""
-    orders = load_orders()
-    orders.append(body)
-    save_orders_locked(orders)
 
-    await manager.broadcast({
-        "channel": "order_sync",
-        "action": "add",
-        "data": {"orders": orders},
-    })
+    def mutate(orders: list[dict]):
+        orders.append(body)
+        return orders, None, {"added": [body]}
 
-    return OrdersResponse(orders=orders)
+    _, orders_json = await order_writer.submit("add", mutate)
+    return _json_response(orders_json)
 
 
-@router.put("/orders/{order_id}")
+@router.put("/orders/{order_id}", response_class=OrjsonResponse)
 async def update_order_fields(order_id: str, req: OrderUpdateRequest):
     """Update manual fields on an existing order."""
     updates = {k: v for k, v in req.model_dump().items() if v is not None}
@@ -74,54 +76,50 @@ async def update_order_fields(order_id: str, req: OrderUpdateRequest):
         raise HTTPException(status_code=400, detail="No fields to update")
 
     # Validate field names
-    for field in updates:
-        if field not in _MANUAL_FIELDS:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Field '{field}' is not editable",
-            )
-
-    orders = update_order(order_id, updates)
-
-    # Recalc PnL if trade fields changed
-    for order in orders:
-        if order.get("id") == order_id:
-            _recalc_pnl(order)
-            break
-    save_orders_locked(orders)
-
-    # Broadcast
-    await manager.broadcast({
-        "channel": "order_sync",
-        "action": "update",
-        "data": {"orders": orders},
-    })
-
-    target = next((o for o in orders if o.get("id") == order_id), None)
-    if target is None:
-        raise HTTPException(status_code=404, detail=f"Order {order_id} not found")
-    return {"order": target}
-
-
-@router.delete("/orders", response_model=OrdersResponse)
+    bad = updates.keys() - _MANUAL_FIELDS
+    if bad:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Fields {sorted(bad)} are not editable",
+        )
+
+    def mutate(orders: list[dict]):
+        target = next((o for o in orders if o.get("id") == order_id), None)
+        if target is None:
+            raise HTTPException(status_code=404, detail=f"Order {order_id} not found")
+        if updates.items() <= target.items():
+            # Re-committed cell with the same value: nothing to save or sync
+            return orders, target, {}
+        target.update(updates)
+        # Recalc PnL in the same pass so the batch serializes once
+        _recalc_pnl(target)
+        return orders, target, {"updated": [target]}
+
+    target, _ = await order_writer.submit("update", mutate)
+    # Returned as a Response so FastAPI skips its jsonable_encoder pass
+    return OrjsonResponse({"order": target})
+
+
+@router.delete("/orders", response_model=None, responses=_ORDERS_DOC)
 async def delete_orders(req: OrderDeleteRequest):
     """Delete orders by ID list."""
     if not req.ids:
         raise HTTPException(status_code=400, detail="No IDs provided")
 
-    orders = load_orders()
-    id_set = set(req.ids)
-    remaining = [o for o in orders if o.get("id") not in id_set]
-
-    if len(remaining) == len(orders):
-        raise HTTPException(status_code=404, detail="No matching orders found")
+    id_set = frozenset(req.ids)
 
-    save_orders_locked(remaining)
-
-    await manager.broadcast({
-        "channel": "order_sync",
-        "action": "delete",
-        "data": {"orders": remaining},
-    })
+    def mutate(orders: list[dict]):
+        remaining: list[dict] = []
+        deleted: list[str] = []
+        for o in orders:
+            oid = o.get("id")
+            if oid in id_set:
+                deleted.append(oid)
+            else:
+                remaining.append(o)
+        if not deleted:
+            raise HTTPException(status_code=404, detail="No matching orders found")
+        return remaining, None, {"deleted": deleted}
 
-    return OrdersResponse(orders=remaining)
+    _, orders_json = await order_writer.submit("delete", mutate)
+    return _json_response(orders_json)
@@ -1,6 +1,8 @@
 """POST /api/parse — parse IDB broker shorthand into a structured order."""
 
 import logging
+from datetime import date
+from functools import lru_cache
 
 from fastapi import APIRouter, HTTPException
 
@@ -12,13 +14,16 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.post("/parse", response_model=ParseResponse)
-def parse_order_text(req: ParseRequest):
-    if not req.text.strip():
-        raise HTTPException(status_code=400, detail="Order text is empty")
+@lru_cache(maxsize=4096)
+def _parse_and_build(text: str, today: date) -> ParseResponse:
+    """Parse *text* and build the response.
 
+    Broker shorthand repeats heavily during a session, so results are cached
+    by stripped text.  *today* is part of the key because year-less expiries
+    ("Apr") resolve relative to the current date.  Exceptions aren't cached.
+    """
     try:
-        order = parse_order(req.text)
+        order = parse_order(text)
     except (ValueError, KeyError, TypeError, AttributeError, IndexError) as e:
         raise HTTPException(
             status_code=400,
@@ -56,3 +61,11 @@ def parse_order_text(req: ParseRequest):
             status_code=500,
             detail=f"Failed to build parse response: {e}",
         )
+
+
+@router.post("/parse", response_model=ParseResponse)
+def parse_order_text(req: ParseRequest):
+    text = req.text.strip()
+    if not text:
+        raise HTTPException(status_code=400, detail="Order text is empty")
+    return _parse_and_build(text, date.today())
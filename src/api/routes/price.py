@@ -1,8 +1,11 @@
 """POST /api/price — fetch market data and price a structure."""
 
+import asyncio
 import logging
+from datetime import date
+from functools import lru_cache
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 
 from options_pricer.models import (
     LegMarketData,
@@ -10,12 +13,12 @@ from options_pricer.models import (
     OptionStructure,
     OptionType,
     ParsedOrder,
-    QuoteSide,
     Side,
 )
 from options_pricer.structure_pricer import price_structure_from_market
 
-from ..dependencies import get_client
+from ..dependencies import get_cached_client, run_market_data
+from ..responses import MsgpackResponse, wants_msgpack
 from ..schemas import (
     BrokerQuote,
     CurrentStructure,
@@ -28,35 +31,47 @@ from ..schemas import (
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-_TYPE_MAP = {"call": OptionType.CALL, "put": OptionType.PUT}
-_SIDE_MAP = {"buy": Side.BUY, "sell": Side.SELL}
+_TYPE_CODE = {OptionType.CALL: "C", OptionType.PUT: "P"}
+_SIDE_SIGN = {Side.BUY: 1, Side.SELL: -1}
+
+# Structure row shown when any leg has no quote. Only ever serialized, so
+# one shared instance serves every failed-quote response.
+_FAILED_STRUCTURE_ROW = LegRow(
+    leg="Structure", expiry="", strike="", type="", ratio="",
+    bid_size="--", bid="--", mid="--", offer="--", offer_size="--",
+)
+
+
+# Fixed English abbreviations: strftime("%b") is locale-dependent, and the
+# frontend parses these labels back with an English month map.
+_MONTH_ABBREV = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+
+
+@lru_cache(maxsize=2048)
+def _fmt_expiry(d: date | None) -> str:
+    """Format an expiry as e.g. 'Mar26' — legs of a spread usually share one."""
+    if not d:
+        return ""
+    return f"{_MONTH_ABBREV[d.month - 1]}{d.year % 100:02d}"
 
 
 def _build_parsed_order(req: PriceRequest) -> ParsedOrder:
-    """Reconstruct a ParsedOrder from the API request."""
-    for i, spec in enumerate(req.legs):
-        if spec.option_type not in _TYPE_MAP:
-            raise ValueError(
-                f"Leg {i + 1}: invalid option_type '{spec.option_type}' "
-                f"(expected 'call' or 'put')"
-            )
-        if spec.side not in _SIDE_MAP:
-            raise ValueError(
-                f"Leg {i + 1}: invalid side '{spec.side}' "
-                f"(expected 'buy' or 'sell')"
-            )
-    if req.quote_side not in ("bid", "offer"):
-        raise ValueError(
-            f"Invalid quote_side '{req.quote_side}' (expected 'bid' or 'offer')"
-        )
+    """Reconstruct a ParsedOrder from the API request.
 
+    Enum fields are already validated by PriceRequest, so legs are built
+    directly without per-leg lookups.
+    """
+    underlying = req.underlying
     legs = [
         OptionLeg(
-            underlying=spec.underlying or req.underlying,
+            underlying=spec.underlying or underlying,
             expiry=spec.expiry,
             strike=spec.strike,
-            option_type=_TYPE_MAP[spec.option_type],
-            side=_SIDE_MAP[spec.side],
+            option_type=spec.option_type,
+            side=spec.side,
             quantity=spec.quantity,
             ratio=spec.ratio,
         )
@@ -64,7 +79,7 @@ def _build_parsed_order(req: PriceRequest) -> ParsedOrder:
     ]
 
     return ParsedOrder(
-        underlying=req.underlying,
+        underlying=underlying,
         structure=OptionStructure(
             name=req.structure_name,
             legs=legs,
@@ -73,66 +88,78 @@ def _build_parsed_order(req: PriceRequest) -> ParsedOrder:
         stock_ref=req.stock_ref,
         delta=req.delta,
         price=req.price,
-        quote_side=QuoteSide(req.quote_side),
+        quote_side=req.quote_side,
         quantity=req.quantity,
         raw_text="",
     )
 
 
-def _fetch_and_price(order: ParsedOrder):
-    """Fetch market data for each leg and price the structure."""
-    client = get_client()
-    spot = client.get_spot(order.underlying)
+async def _fetch_and_price(order: ParsedOrder):
+    """Fetch market data for each leg and price the structure.
+
+    Client calls are blocking, so they run on the market-data pool and are
+    gathered. All legs go out as one batched quote request.
+    """
+    # Cached: repeat prices of the same structure within a second reuse
+    # quotes, and the multiplier is fetched once a day per underlying
+    client = get_cached_client()
+    specs = [
+        (leg.underlying, leg.expiry, leg.strike, leg.option_type.value)
+        for leg in order.structure.legs
+    ]
+    spot, multiplier, quotes = await asyncio.gather(
+        run_market_data(client.get_spot, order.underlying),
+        run_market_data(client.get_contract_multiplier, order.underlying),
+        run_market_data(client.get_option_quotes, specs),
+    )
     if spot is None or spot == 0:
         spot = order.stock_ref if order.stock_ref > 0 else 100.0
 
-    leg_market: list[LegMarketData] = []
-    for leg in order.structure.legs:
-        quote = client.get_option_quote(
-            leg.underlying, leg.expiry, leg.strike, leg.option_type.value,
-        )
-        leg_market.append(LegMarketData(
+    leg_market = [
+        LegMarketData(
             bid=quote.bid,
             bid_size=quote.bid_size,
             offer=quote.offer,
             offer_size=quote.offer_size,
-        ))
+        )
+        for quote in quotes
+    ]
 
     struct_data = price_structure_from_market(order, leg_market, spot)
-    multiplier = client.get_contract_multiplier(order.underlying)
     return spot, leg_market, struct_data, multiplier
 
 
-def _build_table_rows(order: ParsedOrder, leg_market, struct_data) -> list[LegRow]:
-    """Build table rows from a priced order (mirrors app.py _build_table_data)."""
-    rows = []
-    base_qty = (
-        min(leg.quantity for leg in order.structure.legs)
-        if order.structure.legs else 1
-    )
+def _build_table_rows(
+    order: ParsedOrder, leg_market, struct_data,
+) -> tuple[list[LegRow], bool]:
+    """Build table rows from a priced order (mirrors app.py _build_table_data).
 
-    for i, (leg, mkt) in enumerate(zip(order.structure.legs, leg_market)):
-        type_code = "C" if leg.option_type == OptionType.CALL else "P"
-        exp_str = leg.expiry.strftime("%b%y") if leg.expiry else ""
-        ratio = leg.quantity // base_qty
-        signed_ratio = ratio if leg.side == Side.BUY else -ratio
-
-        both_failed = (mkt.bid == 0 and mkt.offer == 0)
-        bid_str = "--" if mkt.bid == 0 else f"{mkt.bid:.2f}"
-        offer_str = "--" if mkt.offer == 0 else f"{mkt.offer:.2f}"
-        if mkt.bid > 0 and mkt.offer > 0:
-            mid_str = f"{(mkt.bid + mkt.offer) / 2.0:.2f}"
+    Returns ``(rows, any_leg_failed)`` so the caller doesn't re-scan the legs.
+    """
+    rows = []
+    any_leg_failed = False
+    base_qty = order.structure.base_quantity
+
+    for i, (leg, mkt) in enumerate(zip(order.structure.legs, leg_market), 1):
+        bid, offer = mkt.bid, mkt.offer
+
+        both_failed = (bid == 0 and offer == 0)
+        any_leg_failed = any_leg_failed or both_failed
+        bid_str = "--" if bid == 0 else format(bid, ".2f")
+        offer_str = "--" if offer == 0 else format(offer, ".2f")
+        if bid > 0 and offer > 0:
+            mid_str = format((bid + offer) / 2.0, ".2f")
         elif both_failed:
             mid_str = "--"
         else:
-            mid_str = bid_str if mkt.bid > 0 else offer_str
+            mid_str = bid_str if bid > 0 else offer_str
 
         rows.append(LegRow(
-            leg=f"Leg {i + 1}",
-            expiry=exp_str,
+            leg="Leg " + str(i),
+            expiry=_fmt_expiry(leg.expiry),
             strike=leg.strike,
-            type=type_code,
-            ratio=signed_ratio,
+            type=_TYPE_CODE[leg.option_type],
+            ratio=_SIDE_SIGN[leg.side] * (leg.quantity // base_qty),
             bid_size="--" if both_failed else str(mkt.bid_size),
             bid=bid_str,
             mid=mid_str,
@@ -140,13 +167,8 @@ def _build_table_rows(order: ParsedOrder, leg_market, struct_data) -> list[LegRo
             offer_size="--" if both_failed else str(mkt.offer_size),
         ))
 
-    any_leg_failed = any(m.bid == 0 and m.offer == 0 for m in leg_market)
-
     if any_leg_failed:
-        rows.append(LegRow(
-            leg="Structure", expiry="", strike="", type="", ratio="",
-            bid_size="--", bid="--", mid="--", offer="--", offer_size="--",
-        ))
+        rows.append(_FAILED_STRUCTURE_ROW)
     else:
         rows.append(LegRow(
             leg="Structure", expiry="", strike="", type="", ratio="",
@@ -157,11 +179,11 @@ def _build_table_rows(order: ParsedOrder, leg_market, struct_data) -> list[LegRo
             offer_size=str(struct_data.structure_offer_size),
         ))
 
-    return rows
+    return rows, any_leg_failed
 
 
 @router.post("/price", response_model=PriceResponse)
-def price_structure(req: PriceRequest):
+async def price_structure(req: PriceRequest, request: Request):
     try:
         order = _build_parsed_order(req)
     except (ValueError, KeyError, TypeError) as e:
@@ -169,18 +191,17 @@ def price_structure(req: PriceRequest):
         raise HTTPException(status_code=422, detail=f"Invalid request: {e}")
 
     try:
-        spot, leg_market, struct_data, multiplier = _fetch_and_price(order)
+        spot, leg_market, struct_data, multiplier = await _fetch_and_price(order)
     except Exception as e:
         logger.exception("Pricing failed for %s", order.underlying)
         raise HTTPException(status_code=500, detail=f"Pricing error: {e}")
 
     try:
-        table_rows = _build_table_rows(order, leg_market, struct_data)
+        table_rows, any_leg_failed = _build_table_rows(order, leg_market, struct_data)
     except Exception as e:
         logger.exception("Failed to build table rows for %s", order.underlying)
         raise HTTPException(status_code=500, detail=f"Response build error: {e}")
 
-    any_leg_failed = any(m.bid == 0 and m.offer == 0 for m in leg_market)
     if any_leg_failed:
         disp_bid = disp_mid = disp_offer = None
         bid_size = offer_size = None
@@ -217,7 +238,7 @@ def price_structure(req: PriceRequest):
     leg_details = []
     for leg in order.structure.legs:
         t = leg.option_type.value[0].upper()
-        exp_str = leg.expiry.strftime("%b%y") if leg.expiry else ""
+        exp_str = _fmt_expiry(leg.expiry)
         leg_details.append(f"{leg.strike:.0f}{t} {exp_str}")
 
     current_structure = CurrentStructure(
@@ -242,9 +263,12 @@ def price_structure(req: PriceRequest):
         len(order.structure.legs),
     )
 
-    return PriceResponse(
+    resp = PriceResponse(
         table_data=table_rows,
         header=header,
         broker_quote=broker_quote,
         current_structure=current_structure,
     )
+    if wants_msgpack(request):
+        return MsgpackResponse(resp.model_dump())
+    return resp
@@ -2,9 +2,9 @@
 
 from fastapi import APIRouter
 
-from options_pricer.bloomberg import BloombergClient, MockBloombergClient
+from options_pricer.bloomberg import MockBloombergClient
 
-from ..dependencies import get_client, set_client
+from ..dependencies import get_bloomberg_client, get_client, get_mock_client, set_client
 from ..schemas import HealthResponse, SourceResponse
 
 router = APIRouter()
@@ -16,9 +16,9 @@ def toggle_source():
     client = get_client()
 
     if isinstance(client, MockBloombergClient):
-        new_client = BloombergClient()
-        if new_client.connect():
-            set_client(new_client)
+        bbg = get_bloomberg_client()
+        if bbg is not None:
+            set_client(bbg)
             return SourceResponse(source="Bloomberg API", connected=True)
         return SourceResponse(
             source="Mock Data",
@@ -26,8 +26,8 @@ def toggle_source():
             error="Bloomberg API connection failed. Check Terminal is running.",
         )
     else:
-        client.disconnect()
-        set_client(MockBloombergClient())
+        # Keep the live session open so switching back is instant
+        set_client(get_mock_client())
         return SourceResponse(source="Mock Data", connected=True)
 
 
@@ -6,6 +6,8 @@ from datetime import date
 
 from pydantic import BaseModel
 
+from options_pricer.models import OptionType, QuoteSide, Side
+
 
 # ---------------------------------------------------------------------------
 # Request models
@@ -20,8 +22,8 @@ class LegSpec(BaseModel):
     underlying: str | None = None
     expiry: date
     strike: float
-    option_type: str  # "call" or "put"
-    side: str  # "buy" or "sell"
+    option_type: OptionType  # "call" or "put"
+    side: Side  # "buy" or "sell"
     quantity: int = 1
     ratio: int = 1
 
@@ -33,7 +35,7 @@ class PriceRequest(BaseModel):
     stock_ref: float = 0.0
     delta: float = 0.0
     price: float = 0.0
-    quote_side: str = "bid"
+    quote_side: QuoteSide = QuoteSide.BID
     quantity: int = 1
 
 
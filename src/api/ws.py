@@ -8,12 +8,14 @@ and broadcasts updates to all connected clients.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
 import time
 from datetime import date
+from functools import lru_cache
 
+import numpy as np
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from options_pricer.models import (
@@ -25,11 +27,22 @@ from options_pricer.models import (
     QuoteSide,
     Side,
 )
-from options_pricer.order_store import load_orders, save_orders_locked
+from options_pricer.order_store import load_orders
 from options_pricer.parser import parse_expiry
 from options_pricer.structure_pricer import price_structure_from_market
 
-from .dependencies import get_client, manager
+from .dependencies import get_cached_client, manager, run_market_data
+from .order_writer import (
+    PRICE_FIELDS,
+    cached_orders_json,
+    live_price,
+    load_orders_json,
+    order_sync_frame,
+    order_writer,
+    orders_version,
+    prune_live_prices,
+    update_live_prices,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -39,31 +52,93 @@ _ticker_subscriptions: dict[WebSocket, str] = {}
 
 _TYPE_MAP = {"C": OptionType.CALL, "P": OptionType.PUT}
 
+_TICK_INTERVAL = 1.0  # seconds between blotter reprices
+
+# Consecutive malformed client frames tolerated before the socket is closed
+_MAX_BAD_FRAMES = 5
+
+# Blotter cell formatting, bound once for the per-order reprice loop
+_FMT2 = "{:.2f}".format
+_FMT_PNL = "{:+,.0f}".format
+_FAILED_PRICES = {
+    "bid": "--", "mid": "--", "offer": "--", "bid_size": "--", "offer_size": "--",
+}
+_SIZE_STRS: dict[int, str] = {}
+# Formatted PnL by its raw inputs (mid, traded_price, size, multiplier,
+# bought_sold); most traded orders' inputs don't move between ticks
+_PNL_STRS: dict[tuple, str] = {}
+
+# Last health frame broadcast; re-sent only when it changes, and replayed to
+# new connections so they don't wait for the next change
+_last_health: bytes | None = None
+
+# Shared stand-in for legs with no quote (LegMarketData is frozen)
+_EMPTY_LEG_MARKET = LegMarketData()
+
+# Table expiries look like "Mar26" (or "Mar" for the current year)
+_EXPIRY_RE = re.compile(r'^([A-Za-z]{3})(\d{2})?$')
+
 
 # ---------------------------------------------------------------------------
 # WebSocket endpoint
 # ---------------------------------------------------------------------------
 
 
+async def _join_with_full_sync(ws: WebSocket) -> None:
+    """Send *ws* a full_sync, then add it to the broadcast set.
+
+    Order mutations are broadcast as patches, so a client starts from a full
+    copy.  It joins only after that copy is sent, so no patch can arrive
+    ahead of an older full_sync and be overwritten by it.  A save or price
+    tick that lands before the join means the copy may have missed it, so
+    it is sent again.
+    """
+    while True:
+        version = orders_version()
+        orders_json = cached_orders_json()
+        if orders_json is None:
+            orders_json = await asyncio.to_thread(load_orders_json)
+        await ws.send_bytes(order_sync_frame("full_sync", orders_json))
+        if orders_version() == version:
+            manager.join(ws)
+            return
+
+
 @router.websocket("/ws/prices")
 async def ws_prices(ws: WebSocket):
-    await manager.connect(ws)
+    await ws.accept()
     try:
-        while True:
-            data = await ws.receive_text()
+        await _join_with_full_sync(ws)
+        if _last_health is not None:
+            await ws.send_bytes(_last_health)
+
+        bad_frames = 0
+        async for data in ws.iter_text():
             try:
-                msg = json.loads(data)
-            except json.JSONDecodeError:
+                msg = orjson.loads(data)
+                action = msg["action"]
+                underlying = msg.get("underlying") or ""
+                if not isinstance(underlying, str):
+                    raise TypeError(underlying)
+            except (orjson.JSONDecodeError, KeyError, TypeError, AttributeError):
+                bad_frames += 1
+                if bad_frames >= _MAX_BAD_FRAMES:
+                    logger.warning("Closing WebSocket after %d malformed frames", bad_frames)
+                    await ws.close(code=1007)
+                    return
                 continue
+            bad_frames = 0
 
-            action = msg.get("action")
             if action == "subscribe_ticker":
-                underlying = msg.get("underlying", "").strip().upper()
+                underlying = underlying.strip().upper()
                 if underlying:
                     _ticker_subscriptions[ws] = underlying
             elif action == "unsubscribe_ticker":
                 _ticker_subscriptions.pop(ws, None)
     except WebSocketDisconnect:
+        # Raised if the client goes away during the initial full_sync send
+        pass
+    finally:
         manager.disconnect(ws)
         _ticker_subscriptions.pop(ws, None)
 
@@ -74,10 +149,16 @@ async def ws_prices(ws: WebSocket):
 
 
 def _parse_expiry_str(expiry_str: str) -> date:
-    s = expiry_str.strip()
-    m = re.match(r'^([A-Za-z]{3})(\d{2})?$', s)
+    return _parse_expiry_cached(expiry_str.strip(), date.today())
+
+
+@lru_cache(maxsize=512)
+def _parse_expiry_cached(s: str, today: date) -> date:
+    # *today* is part of the key because a bare month ("Mar") resolves to
+    # its next occurrence; it isn't used directly.
+    m = _EXPIRY_RE.match(s) if len(s) in (3, 5) else None
     if not m:
-        raise ValueError(f"Invalid expiry: '{expiry_str}'")
+        raise ValueError(f"Invalid expiry: '{s}'")
     return parse_expiry(m.group(1), m.group(2))
 
 
@@ -118,24 +199,164 @@ def _build_legs_from_table(table_data, underlying):
     return legs if legs else None
 
 
-def _recalc_pnl(order: dict) -> None:
-    if (order.get("traded") == "Yes"
-            and order.get("traded_price") not in (None, "")
-            and order.get("bought_sold") in ("Bought", "Sold")):
+# (underlying, expiry, strike, option type) — the quote cache key for a leg
+QuoteKey = tuple[str, date, float, str]
+
+
+def _build_order_legs(order: dict) -> tuple[list[QuoteKey], ParsedOrder] | None:
+    """Rebuild a ParsedOrder from an order's recall fields.
+
+    Returns ``(quote_keys, parsed)`` with one quote key per leg, or None if
+    the order can't be priced.
+    """
+    table_data = order.get("_table_data")
+    underlying = order.get("_underlying")
+    if not table_data or not underlying:
+        return None
+
+    underlying = underlying.strip().upper()
+    legs = _build_legs_from_table(table_data, underlying)
+    if not legs:
+        return None
+
+    struct_name = (order.get("_structure_type") or "custom").replace("_", " ")
+    try:
+        parsed = ParsedOrder(
+            underlying=underlying,
+            structure=OptionStructure(name=struct_name, legs=legs),
+            stock_ref=float(order.get("_stock_ref") or 0),
+            delta=float(order.get("_delta") or 0),
+            price=float(order.get("_broker_price") or 0),
+            quote_side=QuoteSide(order.get("_quote_side", "bid")),
+            quantity=1,
+        )
+    except (ValueError, TypeError):
+        return None
+    keys = [
+        (leg.underlying, leg.expiry, leg.strike, leg.option_type.value)
+        for leg in legs
+    ]
+    return keys, parsed
+
+
+# Built legs per order ID, keyed by the encoded recall fields they came from
+# (plus today's date, since a bare "Mar" expiry resolves relative to it).
+# Most orders don't change between ticks, so this skips the rebuild.
+_parse_cache: dict[str, tuple[bytes, tuple[list[QuoteKey], ParsedOrder] | None]] = {}
+
+# Formatted structure prices per order ID with the inputs they came from
+# (parsed order, spot, leg quotes); quotes often sit still between ticks,
+# and then the order isn't repriced or reformatted.
+_priced_cache: dict[str, tuple[ParsedOrder, float, tuple[LegMarketData, ...], dict]] = {}
+
+
+def _cached_order_legs(order: dict) -> tuple[list[QuoteKey], ParsedOrder] | None:
+    oid = order.get("id")
+    try:
+        key = orjson.dumps((
+            order.get("_table_data"), order.get("_underlying"),
+            order.get("_structure_type"), order.get("_stock_ref"),
+            order.get("_delta"), order.get("_broker_price"),
+            order.get("_quote_side"), date.today().toordinal(),
+        ), default=str)
+    except TypeError:
+        return _build_order_legs(order)
+
+    cached = _parse_cache.get(oid)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    built = _build_order_legs(order)
+    _parse_cache[oid] = (key, built)
+    return built
+
+
+def _evict_stale(orders: list[dict]) -> None:
+    """Drop per-order cache entries for orders that no longer exist."""
+    live = {o.get("id") for o in orders}
+    for oid in _parse_cache.keys() - live:
+        del _parse_cache[oid]
+    for oid in _priced_cache.keys() - live:
+        del _priced_cache[oid]
+    prune_live_prices(live)
+
+
+def _size_str(size: int) -> str:
+    """str(size), memoized — quote sizes repeat heavily across orders and ticks."""
+    text = _SIZE_STRS.get(size)
+    if text is None:
+        if len(_SIZE_STRS) >= 4096:
+            _SIZE_STRS.clear()
+        text = _SIZE_STRS[size] = str(size)
+    return text
+
+
+def _recalc_pnls(orders: list[dict]) -> None:
+    """Update order['pnl'] in place for every order (mirrors callbacks.recalc_pnl).
+
+    Orders whose inputs were seen before reuse the formatted string; the
+    rest go through one NumPy pass, with only the formatting per order.
+    """
+    traded: list[dict] = []
+    pnl_keys: list[tuple] = []
+    mids: list[float] = []
+    traded_prices: list[float] = []
+    sizes: list[int] = []
+    mults: list[float] = []
+    bought: list[bool] = []
+
+    for order in orders:
+        if order.get("traded") != "Yes":
+            order["pnl"] = ""
+            continue
+        bought_sold = order.get("bought_sold")
+        if order.get("traded_price") in (None, "") or bought_sold not in ("Bought", "Sold"):
+            continue
+        pnl_key = (
+            order.get("mid", 0), order["traded_price"], order.get("size", 0),
+            order.get("multiplier", 100), bought_sold,
+        )
+        try:
+            text = _PNL_STRS.get(pnl_key)
+        except TypeError:  # unhashable field value; compute without caching
+            pnl_key, text = None, None
+        if text is not None:
+            order["pnl"] = text
+            continue
         try:
             mid = float(order.get("mid", 0))
             tp = float(order["traded_price"])
             sz = int(order.get("size", 0))
             mult = order.get("multiplier", 100)
-            if order["bought_sold"] == "Bought":
-                pnl = (mid - tp) * sz * mult
-            else:
-                pnl = (tp - mid) * sz * mult
-            order["pnl"] = f"{pnl:+,.0f}"
+            if not isinstance(mult, (int, float)):
+                raise TypeError(mult)
         except (ValueError, TypeError):
             order["pnl"] = ""
-    elif order.get("traded") != "Yes":
-        order["pnl"] = ""
+            continue
+        traded.append(order)
+        pnl_keys.append(pnl_key)
+        mids.append(mid)
+        traded_prices.append(tp)
+        sizes.append(sz)
+        mults.append(mult)
+        bought.append(bought_sold == "Bought")
+
+    if not traded:
+        return
+    mid_arr = np.array(mids)
+    tp_arr = np.array(traded_prices)
+    # Subtract per side rather than negating, so a Sold order at the mid
+    # gives 0.0 ("+0") like the scalar recalc, not -0.0 ("-0")
+    pnls = (
+        np.where(bought, mid_arr - tp_arr, tp_arr - mid_arr)
+        * np.array(sizes, dtype=float)
+        * np.array(mults, dtype=float)
+    )
+    if len(_PNL_STRS) >= 4096:
+        _PNL_STRS.clear()
+    for order, pnl_key, pnl in zip(traded, pnl_keys, pnls.tolist()):
+        text = order["pnl"] = _FMT_PNL(pnl)
+        if pnl_key is not None:
+            _PNL_STRS[pnl_key] = text
 
 
 # ---------------------------------------------------------------------------
@@ -147,16 +368,33 @@ async def price_broadcast_loop():
     """Run every 1s: reprice all blotter orders and broadcast via WebSocket.
 
     Replaces Dash's refresh_blotter_prices callback (app.py lines 1010-1181).
+    Ticks are scheduled against fixed deadlines so a slow fetch doesn't push
+    every later tick back, and an order commit triggers an immediate reprice.
     """
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time() + _TICK_INTERVAL
     while True:
-        await asyncio.sleep(1)
+        await _wait_for_tick(next_tick - loop.time())
+        now = loop.time()
+        if now >= next_tick:
+            next_tick += _TICK_INTERVAL
+            if next_tick <= now:
+                # Fell more than a tick behind; resync rather than burst
+                next_tick = now + _TICK_INTERVAL
 
         try:
-            client = get_client()
+            # Shared with /api/price, so either reuses the other's fresh data
+            client = get_cached_client()
         except RuntimeError:
             continue  # Client not yet initialised
 
+        if not manager.active:
+            # No one to send to (hidden tabs drop their socket); a new
+            # connection gets full_sync and live prices resume next tick
+            continue
+
         orders = load_orders()
+        _evict_stale(orders)
         if not orders:
             # Still broadcast health even with no orders
             await _broadcast_health(client)
@@ -164,41 +402,20 @@ async def price_broadcast_loop():
             continue
 
         # Phase 1: scan orders, build legs, collect unique tickers
-        order_legs: dict[str, tuple[list[OptionLeg], ParsedOrder]] = {}
+        # Holds the order dict itself so Phase 2 needn't rescan `orders`
+        order_legs: dict[str, tuple[dict, list[QuoteKey], ParsedOrder]] = {}
         unique_underlyings: set[str] = set()
-        unique_options: set[tuple[str, date, float, str]] = set()
+        unique_options: set[QuoteKey] = set()
 
         for order in orders:
-            table_data = order.get("_table_data")
-            underlying = order.get("_underlying")
-            if not table_data or not underlying:
-                continue
-
-            underlying = underlying.strip().upper()
-            legs = _build_legs_from_table(table_data, underlying)
-            if not legs:
-                continue
-
-            struct_name = (order.get("_structure_type") or "custom").replace("_", " ")
-            try:
-                parsed = ParsedOrder(
-                    underlying=underlying,
-                    structure=OptionStructure(name=struct_name, legs=legs),
-                    stock_ref=float(order.get("_stock_ref") or 0),
-                    delta=float(order.get("_delta") or 0),
-                    price=float(order.get("_broker_price") or 0),
-                    quote_side=QuoteSide(order.get("_quote_side", "bid")),
-                    quantity=1,
-                )
-            except (ValueError, TypeError):
+            built = _cached_order_legs(order)
+            if built is None:
                 continue
 
-            order_legs[order["id"]] = (legs, parsed)
-            unique_underlyings.add(underlying)
-            for leg in legs:
-                unique_options.add(
-                    (leg.underlying, leg.expiry, leg.strike, leg.option_type.value)
-                )
+            keys, parsed = built
+            order_legs[order["id"]] = (order, keys, parsed)
+            unique_underlyings.add(parsed.underlying)
+            unique_options.update(keys)
 
         if not order_legs:
             await _broadcast_health(client)
@@ -207,16 +424,21 @@ async def price_broadcast_loop():
 
         # Batch fetch
         spot_cache: dict[str, float] = {}
-        multiplier_cache: dict[str, int] = {}
         quote_cache: dict[tuple, LegMarketData] = {}
 
         try:
-            for ul in unique_underlyings:
-                spot_cache[ul] = client.get_spot(ul) or 0.0
-                multiplier_cache[ul] = client.get_contract_multiplier(ul)
-
-            for key in unique_options:
-                q = client.get_option_quote(*key)
+            # One batched request each for spots and quotes, run in worker
+            # threads so the loop keeps serving sockets.
+            underlyings = list(unique_underlyings)
+            option_keys = list(unique_options)
+            spots, quotes = await asyncio.gather(
+                run_market_data(client.get_spots, underlyings),
+                run_market_data(client.get_option_quotes, option_keys),
+            )
+            for ul in underlyings:
+                spot_cache[ul] = spots.get(ul) or 0.0
+
+            for key, q in zip(option_keys, quotes):
                 quote_cache[key] = LegMarketData(
                     bid=q.bid, bid_size=q.bid_size,
                     offer=q.offer, offer_size=q.offer_size,
@@ -228,98 +450,113 @@ async def price_broadcast_loop():
             continue
 
         # Phase 2: price each order from cache
-        changed = False
         price_updates: dict[str, dict] = {}
+        priced: list[dict] = []
 
-        for order in orders:
-            oid = order.get("id")
-            if oid not in order_legs:
-                continue
-
-            legs, parsed = order_legs[oid]
+        for oid, (order, keys, parsed) in order_legs.items():
             spot = spot_cache.get(parsed.underlying, 0.0)
-            leg_market = [
-                quote_cache.get(
-                    (leg.underlying, leg.expiry, leg.strike, leg.option_type.value),
-                    LegMarketData(),
-                )
-                for leg in legs
-            ]
+            leg_market = tuple(quote_cache.get(key, _EMPTY_LEG_MARKET) for key in keys)
+
+            cached = _priced_cache.get(oid)
+            if (cached is not None and cached[0] is parsed
+                    and cached[1] == spot and cached[2] == leg_market):
+                order.update(cached[3])
+                priced.append(order)
+                continue
 
             try:
-                struct_data = price_structure_from_market(parsed, leg_market, spot)
-                any_leg_failed = any(m.bid == 0 and m.offer == 0 for m in leg_market)
-
-                if any_leg_failed:
-                    order["bid"] = "--"
-                    order["mid"] = "--"
-                    order["offer"] = "--"
-                    order["bid_size"] = "--"
-                    order["offer_size"] = "--"
+                if any(m.bid == 0 and m.offer == 0 for m in leg_market):
+                    # The structure price isn't shown, so don't compute it
+                    display = _FAILED_PRICES
                 else:
-                    order["bid"] = f"{struct_data.structure_bid:.2f}"
-                    order["mid"] = f"{struct_data.structure_mid:.2f}"
-                    order["offer"] = f"{struct_data.structure_offer:.2f}"
-                    order["bid_size"] = str(struct_data.structure_bid_size)
-                    order["offer_size"] = str(struct_data.structure_offer_size)
-
-                _recalc_pnl(order)
-                changed = True
-
-                price_updates[oid] = {
-                    "bid": order["bid"],
-                    "mid": order["mid"],
-                    "offer": order["offer"],
-                    "bid_size": order["bid_size"],
-                    "offer_size": order["offer_size"],
-                    "pnl": order.get("pnl", ""),
-                }
+                    struct_data = price_structure_from_market(parsed, leg_market, spot)
+                    display = {
+                        "bid": _FMT2(struct_data.structure_bid),
+                        "mid": _FMT2(struct_data.structure_mid),
+                        "offer": _FMT2(struct_data.structure_offer),
+                        "bid_size": _size_str(struct_data.structure_bid_size),
+                        "offer_size": _size_str(struct_data.structure_offer_size),
+                    }
+                order.update(display)
+                _priced_cache[oid] = (parsed, spot, leg_market, display)
+                priced.append(order)
             except Exception:
                 logger.exception("Blotter reprice failed for order %s", oid)
 
-        if changed:
-            save_orders_locked(orders)
-            await manager.broadcast({
-                "channel": "blotter_prices",
-                "timestamp": time.time(),
-                "data": price_updates,
-            })
+        _recalc_pnls(priced)
+
+        for order in priced:
+            oid = order["id"]
+            # Only orders whose values moved since the last tick are sent
+            fields = {f: order.get(f, "") for f in PRICE_FIELDS}
+            if live_price(oid) != fields:
+                price_updates[oid] = fields
+
+        # Prices stay in memory; the order file only changes on user edits
+        if price_updates:
+            update_live_prices(price_updates)
+            frame = orjson.dumps(
+                {
+                    "channel": "blotter_prices",
+                    "timestamp": time.time(),
+                    "data": price_updates,
+                },
+            )
+            await manager.broadcast(None, precomputed=frame)
 
         await _broadcast_health(client)
         await _broadcast_ticker_prices(client)
 
 
-async def _broadcast_health(client) -> None:
-    """Broadcast bloomberg health status."""
-    spot_check = client.get_spot("SPY")
-    await manager.broadcast({
+async def _wait_for_tick(timeout: float) -> None:
+    """Sleep until the next tick is due or the order writer commits a batch."""
+    committed = order_writer.committed
+    if committed is None:
+        await asyncio.sleep(max(0.0, timeout))
+        return
+    try:
+        await asyncio.wait_for(committed.wait(), max(0.0, timeout))
+    except asyncio.TimeoutError:
+        pass
+    committed.clear()
+
+
+@lru_cache(maxsize=8)
+def _health_frame(source: str, status: str) -> bytes:
+    """Encoded health message; there are only a few distinct ones."""
+    return orjson.dumps({
         "channel": "health",
-        "data": {
-            "source": client.source_name,
-            "status": "ok" if spot_check else "failing",
-        },
+        "data": {"source": source, "status": status},
     })
 
 
+async def _broadcast_health(client) -> None:
+    """Broadcast bloomberg health status when it changes."""
+    global _last_health
+    if not manager.active:
+        return
+    spot_check = await run_market_data(client.get_spot, "SPY")
+    frame = _health_frame(client.source_name, "ok" if spot_check else "failing")
+    if frame == _last_health:
+        return
+    _last_health = frame
+    await manager.broadcast(None, precomputed=frame)
+
+
 async def _broadcast_ticker_prices(client) -> None:
-    """Broadcast live stock prices for subscribed tickers."""
+    """Broadcast live stock prices ``{ticker: price}`` to ticker subscribers."""
     if not _ticker_subscriptions:
         return
 
     # Deduplicate tickers
-    tickers = set(_ticker_subscriptions.values())
-    prices: dict[str, float] = {}
-    for ticker in tickers:
-        price = client.get_spot(ticker)
-        if price is not None:
-            prices[ticker] = price
-
-    for ws, ticker in list(_ticker_subscriptions.items()):
-        if ticker in prices:
-            try:
-                await ws.send_text(json.dumps({
-                    "channel": "stock_price",
-                    "data": {"underlying": ticker, "price": prices[ticker]},
-                }))
-            except Exception:
-                _ticker_subscriptions.pop(ws, None)
+    tickers = list(set(_ticker_subscriptions.values()))
+    prices = await run_market_data(client.get_spots, tickers)
+
+    if not prices:
+        return
+    # One frame with every subscribed ticker's price, encoded once and sent
+    # to all subscribers; each client picks out its own ticker.
+    frame = orjson.dumps({"channel": "stock_prices", "data": prices})
+    for ws in await manager.send_each([(ws, frame) for ws in _ticker_subscriptions]):
+        _ticker_subscriptions.pop(ws, None)
+        await manager.drop(ws)
@@ -6,9 +6,13 @@ without a Bloomberg Terminal connection.
 
 import logging
 import math
+import random
+import threading
 from dataclasses import dataclass, field
 from datetime import date
+from types import MappingProxyType
 
+import numpy as np
 from scipy.stats import norm
 
 logger = logging.getLogger(__name__)
@@ -42,6 +46,10 @@ class BloombergClient:
         self._host = host
         self._port = port
         self._session = None
+        # Request/response cycles drain the shared session with nextEvent(),
+        # so concurrent callers (API thread pool) must take turns or they
+        # would consume each other's responses.
+        self._request_lock = threading.Lock()
 
     @property
     def source_name(self) -> str:
@@ -68,84 +76,127 @@ class BloombergClient:
             self._session.stop()
             self._session = None
 
-    def get_spot(self, underlying: str) -> float | None:
-        if not self._session:
-            return None
-        try:
-            import blpapi
+    def ping(self) -> bool:
+        """Keepalive check: True if the session still answers a spot request."""
+        return self._session is not None and self.get_spot("SPY") is not None
+
+    def _reference_data(self, securities: list[str], fields: list[str], extract) -> dict:
+        """Send one ReferenceDataRequest for all *securities* and *fields*.
 
+        Returns ``{security: extract(field_data, security)}``; securities whose
+        extract raises (e.g. a missing field) are left out.  Request errors
+        propagate to the caller.
+        """
+        import blpapi
+
+        results: dict = {}
+        with self._request_lock:
             refdata = self._session.getService("//blp/refdata")
             request = refdata.createRequest("ReferenceDataRequest")
-            request.append("securities", f"{underlying} US Equity")
-            request.append("fields", "PX_LAST")
+            for security in dict.fromkeys(securities):
+                request.append("securities", security)
+            for name in fields:
+                request.append("fields", name)
             self._session.sendRequest(request)
 
             while True:
                 event = self._session.nextEvent(500)
                 for msg in event:
                     if msg.hasElement("securityData"):
-                        sec_data = msg.getElement("securityData").getValueAsElement(0)
-                        field_data = sec_data.getElement("fieldData")
-                        return field_data.getElementAsFloat("PX_LAST")
+                        sec_array = msg.getElement("securityData")
+                        for i in range(sec_array.numValues()):
+                            sec_data = sec_array.getValueAsElement(i)
+                            security = sec_data.getElementAsString("security")
+                            try:
+                                results[security] = extract(
+                                    sec_data.getElement("fieldData"), security,
+                                )
+                            except Exception:
+                                logger.debug("%s missing for %s", fields, security)
                 if event.eventType() == blpapi.Event.RESPONSE:
                     break
+        return results
+
+    def get_spot(self, underlying: str) -> float | None:
+        return self.get_spots([underlying]).get(underlying)
+
+    def get_spots(self, underlyings: list[str]) -> dict[str, float]:
+        """Fetch PX_LAST for many underlyings in one request.
+
+        Underlyings without a price are omitted from the result.
+        """
+        if not self._session or not underlyings:
+            return {}
+        try:
+            prices = self._reference_data(
+                [f"{ul} US Equity" for ul in underlyings], ["PX_LAST"],
+                lambda fd, _: fd.getElementAsFloat("PX_LAST"),
+            )
         except Exception:
-            logger.warning("Failed to fetch spot for %s", underlying, exc_info=True)
-            return None
+            logger.warning("Failed to fetch spot for %s", underlyings, exc_info=True)
+            return {}
+        return {
+            ul: prices[f"{ul} US Equity"]
+            for ul in underlyings if f"{ul} US Equity" in prices
+        }
+
+    @staticmethod
+    def _option_ticker(
+        underlying: str, expiry: date, strike: float, option_type: str,
+    ) -> str:
+        # Format: "AAPL 06/16/26 C300 Equity" for AAPL Jun26 300 Call
+        exp_str = expiry.strftime("%m/%d/%y")
+        type_char = "C" if option_type == "call" else "P"
+        return f"{underlying} {exp_str} {type_char}{strike:.0f} Equity"
+
+    @staticmethod
+    def _quote_from_field_data(fd, ticker: str) -> OptionQuote:
+        quote = OptionQuote()
+        try:
+            quote.bid = fd.getElementAsFloat("BID")
+        except Exception:
+            logger.debug("BID field missing for %s", ticker)
+        try:
+            quote.offer = fd.getElementAsFloat("ASK")
+        except Exception:
+            logger.debug("ASK field missing for %s", ticker)
+        try:
+            quote.bid_size = int(fd.getElementAsFloat("BID_SIZE"))
+        except Exception:
+            logger.debug("BID_SIZE field missing for %s", ticker)
+        try:
+            quote.offer_size = int(fd.getElementAsFloat("ASK_SIZE"))
+        except Exception:
+            logger.debug("ASK_SIZE field missing for %s", ticker)
+        return quote
 
     def get_option_quote(
         self, underlying: str, expiry: date, strike: float, option_type: str,
     ) -> OptionQuote:
         """Fetch live bid/offer/size for a specific option from Bloomberg."""
-        if not self._session:
-            return OptionQuote()
+        return self.get_option_quotes([(underlying, expiry, strike, option_type)])[0]
+
+    def get_option_quotes(
+        self, specs: list[tuple[str, date, float, str]],
+    ) -> list[OptionQuote]:
+        """Fetch quotes for many options in one ReferenceDataRequest.
+
+        *specs* are ``(underlying, expiry, strike, option_type)`` tuples.
+        Returns one OptionQuote per spec, in order; options Bloomberg
+        doesn't return come back as empty quotes.
+        """
+        if not self._session or not specs:
+            return [OptionQuote() for _ in specs]
+        tickers = [self._option_ticker(*spec) for spec in specs]
         try:
-            import blpapi
-
-            # Build Bloomberg option ticker
-            # Format: "AAPL 06/16/26 C300 Equity" for AAPL Jun26 300 Call
-            exp_str = expiry.strftime("%m/%d/%y")
-            type_char = "C" if option_type == "call" else "P"
-            ticker = f"{underlying} {exp_str} {type_char}{strike:.0f} Equity"
-
-            refdata = self._session.getService("//blp/refdata")
-            request = refdata.createRequest("ReferenceDataRequest")
-            request.append("securities", ticker)
-            request.append("fields", "BID")
-            request.append("fields", "ASK")
-            request.append("fields", "BID_SIZE")
-            request.append("fields", "ASK_SIZE")
-            self._session.sendRequest(request)
-
-            quote = OptionQuote()
-            while True:
-                event = self._session.nextEvent(500)
-                for msg in event:
-                    if msg.hasElement("securityData"):
-                        sec_data = msg.getElement("securityData").getValueAsElement(0)
-                        fd = sec_data.getElement("fieldData")
-                        try:
-                            quote.bid = fd.getElementAsFloat("BID")
-                        except Exception:
-                            logger.debug("BID field missing for %s", ticker)
-                        try:
-                            quote.offer = fd.getElementAsFloat("ASK")
-                        except Exception:
-                            logger.debug("ASK field missing for %s", ticker)
-                        try:
-                            quote.bid_size = int(fd.getElementAsFloat("BID_SIZE"))
-                        except Exception:
-                            logger.debug("BID_SIZE field missing for %s", ticker)
-                        try:
-                            quote.offer_size = int(fd.getElementAsFloat("ASK_SIZE"))
-                        except Exception:
-                            logger.debug("ASK_SIZE field missing for %s", ticker)
-                if event.eventType() == blpapi.Event.RESPONSE:
-                    break
-            return quote
+            quotes = self._reference_data(
+                tickers, ["BID", "ASK", "BID_SIZE", "ASK_SIZE"],
+                self._quote_from_field_data,
+            )
+            return [quotes.get(ticker) or OptionQuote() for ticker in tickers]
         except Exception:
-            logger.warning("Failed to fetch option quote for %s", ticker, exc_info=True)
-            return OptionQuote()
+            logger.warning("Failed to fetch option quotes for %s", tickers, exc_info=True)
+            return [OptionQuote() for _ in specs]
 
     def get_implied_vol(
         self, underlying: str, expiry: date, strike: float,
@@ -163,27 +214,16 @@ class BloombergClient:
         """Fetch OPT_CONT_SIZE from Bloomberg for the underlying's options."""
         if not self._session:
             return 100
+        key = f"{underlying} US Equity"
         try:
-            import blpapi
-
-            refdata = self._session.getService("//blp/refdata")
-            request = refdata.createRequest("ReferenceDataRequest")
-            request.append("securities", f"{underlying} US Equity")
-            request.append("fields", "OPT_CONT_SIZE")
-            self._session.sendRequest(request)
-
-            while True:
-                event = self._session.nextEvent(500)
-                for msg in event:
-                    if msg.hasElement("securityData"):
-                        sec_data = msg.getElement("securityData").getValueAsElement(0)
-                        field_data = sec_data.getElement("fieldData")
-                        return int(field_data.getElementAsFloat("OPT_CONT_SIZE"))
-                if event.eventType() == blpapi.Event.RESPONSE:
-                    break
+            sizes = self._reference_data(
+                [key], ["OPT_CONT_SIZE"],
+                lambda fd, _: int(fd.getElementAsFloat("OPT_CONT_SIZE")),
+            )
         except Exception:
             logger.warning("Failed to fetch contract multiplier for %s", underlying, exc_info=True)
-        return 100
+            return 100
+        return sizes.get(key, 100)
 
     def get_market_data(self, underlying: str) -> MarketData:
         spot = self.get_spot(underlying)
@@ -202,7 +242,8 @@ class MockBloombergClient:
     def source_name(self) -> str:
         return "Mock Data"
 
-    _MOCK_SPOTS: dict[str, float] = {
+    # Read-only: shared by every mock client instance
+    _MOCK_SPOTS: MappingProxyType[str, float] = MappingProxyType({
         "AAPL": 250.30,
         "MSFT": 415.20,
         "GOOGL": 175.80,
@@ -218,9 +259,9 @@ class MockBloombergClient:
         "VST": 171.10,
         "SPX": 5204.00,
         "NFLX": 950.00,
-    }
+    })
 
-    _MOCK_VOLS: dict[str, float] = {
+    _MOCK_VOLS: MappingProxyType[str, float] = MappingProxyType({
         "AAPL": 0.22,
         "MSFT": 0.20,
         "GOOGL": 0.25,
@@ -236,7 +277,7 @@ class MockBloombergClient:
         "VST": 0.38,
         "SPX": 0.14,
         "NFLX": 0.34,
-    }
+    })
 
     def connect(self) -> bool:
         return True
@@ -247,45 +288,64 @@ class MockBloombergClient:
     def get_spot(self, underlying: str) -> float:
         return self._MOCK_SPOTS.get(underlying.upper(), 100.0)
 
+    def get_spots(self, underlyings: list[str]) -> dict[str, float]:
+        return {ul: self.get_spot(ul) for ul in underlyings}
+
     def get_option_quote(
         self, underlying: str, expiry: date, strike: float, option_type: str,
     ) -> OptionQuote:
         """Generate realistic option quotes using Black-Scholes with a spread."""
-        spot = self.get_spot(underlying)
-        vol = self._get_vol(underlying, strike, spot)
+        return self.get_option_quotes([(underlying, expiry, strike, option_type)])[0]
+
+    def get_option_quotes(
+        self, specs: list[tuple[str, date, float, str]],
+    ) -> list[OptionQuote]:
+        """Price every spec in one vectorized Black-Scholes pass."""
+        if not specs:
+            return []
         rate = 0.05
-
         today = date.today()
-        T = max((expiry - today).days / 365.0, 0.001)
+
+        spot = np.array([self.get_spot(ul) for ul, _, _, _ in specs])
+        strike = np.array([float(k) for _, _, k, _ in specs])
+        vol = np.array([
+            self._get_vol(ul, k, s) for (ul, _, k, _), s in zip(specs, spot.tolist())
+        ])
+        T = np.maximum(
+            np.array([(exp - today).days for _, exp, _, _ in specs]) / 365.0, 0.001,
+        )
+        is_call = np.array([opt == "call" for _, _, _, opt in specs])
 
         # Calculate theoretical price via Black-Scholes
-        theo = self._bs_price(spot, strike, T, rate, vol, option_type)
+        theo = self._bs_prices(spot, strike, T, rate, vol, is_call)
 
         # Add realistic bid-ask spread (wider for further OTM)
-        moneyness = abs(spot - strike) / spot
+        moneyness = np.abs(spot - strike) / spot
         spread_pct = 0.02 + 0.03 * moneyness  # 2-5% spread
-        half_spread = max(theo * spread_pct, 0.05)
-
-        bid = max(theo - half_spread, 0.01)
-        offer = theo + half_spread
-
-        # Generate realistic sizes
-        import random
-        random.seed(int(strike * 100 + spot * 10))
-        bid_size = random.randint(100, 1000)
-        offer_size = random.randint(100, 800)
-
-        return OptionQuote(
-            bid=round(bid, 2),
-            bid_size=bid_size,
-            offer=round(offer, 2),
-            offer_size=offer_size,
-        )
+        half_spread = np.maximum(theo * spread_pct, 0.05)
+
+        bids = np.maximum(theo - half_spread, 0.01).tolist()
+        offers = (theo + half_spread).tolist()
+
+        quotes = []
+        for k, s, bid, offer in zip(strike.tolist(), spot.tolist(), bids, offers):
+            # Generate realistic sizes, stable per strike/spot, from a local
+            # generator so the process-wide random state is left alone
+            rng = random.Random(int(k * 100 + s * 10))
+            bid_size = rng.randint(100, 1000)
+            offer_size = rng.randint(100, 800)
+            quotes.append(OptionQuote(
+                bid=round(bid, 2),
+                bid_size=bid_size,
+                offer=round(offer, 2),
+                offer_size=offer_size,
+            ))
+        return quotes
 
     def get_implied_vol(
         self, underlying: str, expiry: date, strike: float,
     ) -> float:
-        spot = self.get_spot(underlying)
+        spot = self._MOCK_SPOTS.get(underlying.upper(), 100.0)
         return self._get_vol(underlying, strike, spot)
 
     def get_risk_free_rate(self) -> float:
@@ -304,10 +364,8 @@ class MockBloombergClient:
 
     def _get_vol(self, underlying: str, strike: float, spot: float) -> float:
         base_vol = self._MOCK_VOLS.get(underlying.upper(), 0.25)
-        moneyness = strike / spot
-        # Vol skew: OTM puts have higher vol
-        skew = 0.05 * (1.0 - moneyness) if moneyness < 1.0 else 0.0
-        return base_vol + skew
+        # Vol skew: OTM puts (strike below spot) have higher vol
+        return base_vol + 0.05 * max(0.0, 1.0 - strike / spot)
 
     @staticmethod
     def _bs_price(
@@ -324,6 +382,26 @@ class MockBloombergClient:
         else:
             return K * math.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
 
+    @staticmethod
+    def _bs_prices(
+        S: np.ndarray, K: np.ndarray, T: np.ndarray, r: float,
+        sigma: np.ndarray, is_call: np.ndarray,
+    ) -> np.ndarray:
+        """Array form of _bs_price; degenerate inputs fall back to intrinsic."""
+        valid = (S > 0) & (K > 0) & (sigma > 0)
+        intrinsic = np.where(is_call, np.maximum(S - K, 0.0), np.maximum(K - S, 0.0))
+        # Stand-in inputs keep the log/divide finite where they're not used
+        S_ = np.where(valid, S, 1.0)
+        K_ = np.where(valid, K, 1.0)
+        sig = np.where(valid, sigma, 1.0)
+        sqrt_T = np.sqrt(T)
+        d1 = (np.log(S_ / K_) + (r + 0.5 * sig**2) * T) / (sig * sqrt_T)
+        d2 = d1 - sig * sqrt_T
+        disc = K_ * np.exp(-r * T)
+        call = S_ * norm.cdf(d1) - disc * norm.cdf(d2)
+        put = disc * norm.cdf(-d2) - S_ * norm.cdf(-d1)
+        return np.where(valid, np.where(is_call, call, put), intrinsic)
+
 
 def create_client(use_mock: bool = False, **kwargs) -> BloombergClient | MockBloombergClient:
     """Factory to create a Bloomberg client, falling back to mock if needed."""
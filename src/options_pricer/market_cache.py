@@ -0,0 +1,136 @@
+"""Short-lived caching in front of a market data client.
+
+Re-pricing the same structure several times a second (field edits, repeat
+clicks) would otherwise re-request identical quotes, and the contract
+multiplier is effectively static per underlying.  The blotter loop shares
+the same instance, so a price request right after a tick reuses its data.
+Each method gets its own TTL: long for static data, sub-second for live
+prices (shorter than the 1s blotter tick, so ticks always refetch).
+"""
+
+import threading
+import time
+from datetime import date
+from typing import Any, Callable
+
+from .bloomberg import OptionQuote
+
+SPOT_TTL = 0.5
+QUOTE_TTL = 0.5
+MULTIPLIER_TTL = 86400.0
+
+_MAX_ENTRIES = 1024
+
+
+class _TTLCache:
+    """Dict with per-entry expiry; evicts expired then oldest entries when full."""
+
+    def __init__(self, ttl: float, clock: Callable[[], float]):
+        self._ttl = ttl
+        self._clock = clock
+        self._data: dict[Any, tuple[float, Any]] = {}
+
+    def get(self, key) -> tuple[bool, Any]:
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= self._clock():
+            return False, None
+        return True, entry[1]
+
+    def put(self, key, value) -> None:
+        if len(self._data) >= _MAX_ENTRIES and key not in self._data:
+            now = self._clock()
+            for k in [k for k, (exp, _) in self._data.items() if exp <= now]:
+                del self._data[k]
+            if len(self._data) >= _MAX_ENTRIES:
+                del self._data[next(iter(self._data))]
+        self._data[key] = (self._clock() + self._ttl, value)
+
+
+class CachedMarketClient:
+    """Wrap a BloombergClient / MockBloombergClient with TTL caches.
+
+    Cached: get_spot(s), get_contract_multiplier, get_option_quote(s).  A
+    missing spot is not cached so a failed fetch is retried next call.
+    Everything else is passed through to the wrapped client.  Safe to call
+    from several threads.
+    """
+
+    def __init__(self, client, clock: Callable[[], float] = time.monotonic):
+        self.client = client
+        self._lock = threading.Lock()
+        self._spots = _TTLCache(SPOT_TTL, clock)
+        self._quotes = _TTLCache(QUOTE_TTL, clock)
+        self._multipliers = _TTLCache(MULTIPLIER_TTL, clock)
+
+    def __getattr__(self, name: str):
+        return getattr(self.client, name)
+
+    def get_spot(self, underlying: str) -> float | None:
+        with self._lock:
+            hit, spot = self._spots.get(underlying)
+        if hit:
+            return spot
+        spot = self.client.get_spot(underlying)
+        if spot is not None:
+            with self._lock:
+                self._spots.put(underlying, spot)
+        return spot
+
+    def get_spots(self, underlyings: list[str]) -> dict[str, float]:
+        """Return cached spots, fetching all misses in one client call."""
+        spots: dict[str, float] = {}
+        missing: list[str] = []
+        with self._lock:
+            for ul in underlyings:
+                hit, spot = self._spots.get(ul)
+                if hit:
+                    spots[ul] = spot
+                else:
+                    missing.append(ul)
+        if missing:
+            fetched = self.client.get_spots(list(dict.fromkeys(missing)))
+            with self._lock:
+                for ul, spot in fetched.items():
+                    if spot is not None:
+                        self._spots.put(ul, spot)
+            spots.update(fetched)
+        return spots
+
+    def get_contract_multiplier(self, underlying: str) -> int:
+        with self._lock:
+            hit, multiplier = self._multipliers.get(underlying)
+        if hit:
+            return multiplier
+        multiplier = self.client.get_contract_multiplier(underlying)
+        with self._lock:
+            self._multipliers.put(underlying, multiplier)
+        return multiplier
+
+    def get_option_quote(
+        self, underlying: str, expiry: date, strike: float, option_type: str,
+    ) -> OptionQuote:
+        return self.get_option_quotes([(underlying, expiry, strike, option_type)])[0]
+
+    def get_option_quotes(
+        self, specs: list[tuple[str, date, float, str]],
+    ) -> list[OptionQuote]:
+        """Return cached quotes, fetching all misses in one client call."""
+        quotes: list[OptionQuote | None] = []
+        with self._lock:
+            for spec in specs:
+                hit, quote = self._quotes.get(spec)
+                quotes.append(quote if hit else None)
+
+        missing = list(dict.fromkeys(
+            spec for spec, quote in zip(specs, quotes) if quote is None
+        ))
+        if missing:
+            fetched = dict(zip(missing, self.client.get_option_quotes(missing)))
+            with self._lock:
+                for spec, quote in fetched.items():
+                    self._quotes.put(spec, quote)
+            quotes = [
+                quote if quote is not None else fetched[spec]
+                for spec, quote in zip(specs, quotes)
+            ]
+        return quotes
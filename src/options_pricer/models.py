@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
+from functools import cached_property
 
 
 class OptionType(Enum):
@@ -20,7 +21,7 @@ class QuoteSide(Enum):
     OFFER = "offer"
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionLeg:
     """A single option leg within a structure."""
 
@@ -68,6 +69,16 @@ class OptionStructure:
             for i in range(steps + 1)
         ]
 
+    @cached_property
+    def base_quantity(self) -> int:
+        """Smallest leg quantity, used to reduce leg quantities to ratios.
+
+        Falls back to 1 for an empty or non-positive structure.  Computed
+        once; legs are not modified after a structure is built.
+        """
+        base = min((leg.quantity for leg in self.legs), default=1)
+        return base if base > 0 else 1
+
     @property
     def net_quantity(self) -> int:
         return sum(leg.direction * leg.quantity for leg in self.legs)
@@ -91,9 +102,12 @@ class ParsedOrder:
     raw_text: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LegMarketData:
-    """Market data for a single option leg from screen."""
+    """Market data for a single option leg from screen.
+
+    Immutable, so one empty instance can stand in for every missing quote.
+    """
 
     bid: float = 0.0
     bid_size: int = 0
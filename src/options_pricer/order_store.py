@@ -8,7 +8,6 @@ data loss when two dashboard processes perform concurrent read-modify-write
 cycles.
 """
 
-import json
 import logging
 import os
 import re
@@ -18,6 +17,9 @@ import time
 from contextlib import contextmanager
 from datetime import date
 from pathlib import Path
+from typing import Callable
+
+import orjson
 
 if sys.platform == "win32":
     import msvcrt
@@ -54,8 +56,7 @@ def _migrate_legacy_orders() -> None:
         return  # Already migrated
 
     try:
-        with open(_LEGACY_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(_LEGACY_FILE.read_bytes())
         orders = data.get("orders", [])
         _ORDERS_DIR.mkdir(parents=True, exist_ok=True)
         if orders:
@@ -136,10 +137,9 @@ def load_orders(filepath: Path | None = None) -> list[dict]:
     if not fp.exists():
         return []
     try:
-        with open(fp, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(fp.read_bytes())
         return data.get("orders", [])
-    except (json.JSONDecodeError, KeyError, IOError):
+    except (orjson.JSONDecodeError, KeyError, IOError):
         return []
 
 
@@ -152,8 +152,12 @@ def save_orders(orders: list[dict], filepath: Path | None = None) -> None:
         dir=str(fp.parent), suffix=".tmp", prefix=".orders_"
     )
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump({"orders": orders}, f, indent=2, default=str)
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(
+                {"orders": orders},
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ))
         os.replace(tmp_path, str(fp))
     except Exception:
         try:
@@ -173,16 +177,43 @@ def add_order(order: dict, filepath: Path | None = None) -> list[dict]:
     return orders
 
 
-def update_order(order_id: str, updates: dict, filepath: Path | None = None) -> list[dict]:
-    """Update an existing order by ID and persist. Returns updated orders list."""
+def apply_order_update(
+    orders: list[dict],
+    order_id: str,
+    updates: dict,
+    post_hook: Callable[[dict], None] | None = None,
+) -> dict | None:
+    """Apply *updates* in place to the order with *order_id*.
+
+    *post_hook* (e.g. a PnL recalc) runs on the updated order so derived
+    fields are fixed up before the list is serialized. Returns the updated
+    order, or None if no order has that ID.
+    """
+    for order in orders:
+        if order.get("id") == order_id:
+            order.update(updates)
+            if post_hook is not None:
+                post_hook(order)
+            return order
+    return None
+
+
+def update_order(
+    order_id: str,
+    updates: dict,
+    filepath: Path | None = None,
+    post_hook: Callable[[dict], None] | None = None,
+) -> list[dict]:
+    """Update an existing order by ID and persist. Returns updated orders list.
+
+    The file is loaded and written once; *post_hook* is applied to the
+    updated order before the write (see apply_order_update).
+    """
     fp = filepath or _orders_file_for_date()
     with _file_lock(filepath):
         orders = load_orders(fp)
-        for order in orders:
-            if order.get("id") == order_id:
-                order.update(updates)
-                break
-        save_orders(orders, fp)
+        if apply_order_update(orders, order_id, updates, post_hook) is not None:
+            save_orders(orders, fp)
     return orders
 
 
@@ -196,6 +227,15 @@ def save_orders_locked(orders: list[dict], filepath: Path | None = None) -> None
         save_orders(orders, filepath)
 
 
+def index_orders(orders: list[dict]) -> dict[str, dict]:
+    """Map order ID -> order dict for O(1) lookup.
+
+    Values are the same dict objects as in *orders*, so in-place edits
+    through the index are visible in the list.
+    """
+    return {o["id"]: o for o in orders if "id" in o}
+
+
 def orders_to_display(orders: list[dict]) -> list[dict]:
     """Strip private underscore-prefixed keys for blotter display."""
     return [
@@ -213,6 +253,20 @@ def get_orders_mtime(filepath: Path | None = None) -> float:
         return 0.0
 
 
+def get_orders_stamp(filepath: Path | None = None) -> tuple[int, int]:
+    """Return ``(mtime_ns, size)`` of the orders file, or ``(0, 0)`` if missing.
+
+    One stat call; cheaper to compare than a float mtime, and the size
+    catches two writes that land within the filesystem's mtime resolution.
+    """
+    fp = filepath or _orders_file_for_date()
+    try:
+        st = fp.stat()
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
 def list_order_dates(dirpath: Path | None = None) -> list[date]:
     """List available order dates, sorted most recent first.
 
@@ -33,9 +33,7 @@ def price_structure_from_market(
             f"Leg count mismatch: {len(legs)} legs but {len(leg_market)} market entries"
         )
 
-    base_qty = min(leg.quantity for leg in legs) if legs else 1
-    if base_qty <= 0:
-        base_qty = 1
+    base_qty = order.structure.base_quantity
 
     struct_bid = 0.0
     struct_offer = 0.0
@@ -59,8 +57,8 @@ def price_structure_from_market(
     struct_offer += tie_adj
 
     # Calculate structure sizes (limited by thinnest leg adjusted for ratio)
-    struct_bid_size = _calc_structure_size(legs, leg_market, for_bid=True)
-    struct_offer_size = _calc_structure_size(legs, leg_market, for_bid=False)
+    struct_bid_size = _calc_structure_size(legs, leg_market, base_qty, for_bid=True)
+    struct_offer_size = _calc_structure_size(legs, leg_market, base_qty, for_bid=False)
 
     return StructureMarketData(
         leg_data=list(zip(legs, leg_market)),
@@ -77,6 +75,7 @@ def price_structure_from_market(
 def _calc_structure_size(
     legs: list[OptionLeg],
     leg_market: list[LegMarketData],
+    base_qty: int,
     for_bid: bool,
 ) -> int:
     """Calculate max structure quantity based on screen liquidity.
@@ -85,9 +84,6 @@ def _calc_structure_size(
     to find how many structures can be filled.
     """
     min_structures = float("inf")
-    base_qty = min(leg.quantity for leg in legs) if legs else 1
-    if base_qty <= 0:
-        base_qty = 1
 
     for leg, mkt in zip(legs, leg_market):
         is_buy = leg.direction > 0
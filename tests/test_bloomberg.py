@@ -0,0 +1,87 @@
+"""Tests for the mock market data client."""
+
+import random
+from datetime import date, timedelta
+
+import numpy as np
+
+from options_pricer.bloomberg import MockBloombergClient
+
+
+class TestMockOptionQuotes:
+    def _specs(self):
+        expiry = date.today() + timedelta(days=90)
+        return [
+            ("AAPL", expiry, 250.0, "call"),
+            ("AAPL", expiry, 220.0, "put"),
+            ("SPX", expiry, 5200.0, "put"),
+            ("UNKNOWN", expiry, 100.0, "call"),
+        ]
+
+    @staticmethod
+    def _scalar_quote(client, underlying, expiry, strike, option_type):
+        """Quote built leg by leg from the scalar _bs_price."""
+        spot = client.get_spot(underlying)
+        vol = client._get_vol(underlying, strike, spot)
+        T = max((expiry - date.today()).days / 365.0, 0.001)
+        theo = client._bs_price(spot, strike, T, 0.05, vol, option_type)
+        spread_pct = 0.02 + 0.03 * abs(spot - strike) / spot
+        half_spread = max(theo * spread_pct, 0.05)
+        return max(theo - half_spread, 0.01), theo + half_spread
+
+    def test_bs_prices_match_scalar(self):
+        cases = [
+            (S, K, T, sigma, opt)
+            for S in (50.0, 250.0)
+            for K in (0.0, 40.0, 250.0, 400.0)
+            for T in (0.001, 0.25, 2.0)
+            for sigma in (0.0, 0.2, 0.6)
+            for opt in ("call", "put")
+        ]
+        S, K, T, sigma = (np.array(col) for col in list(zip(*cases))[:4])
+        is_call = np.array([opt == "call" for *_, opt in cases])
+        batch = MockBloombergClient._bs_prices(S, K, T, 0.05, sigma, is_call)
+        scalar = [MockBloombergClient._bs_price(*case[:3], 0.05, *case[3:]) for case in cases]
+        np.testing.assert_allclose(batch, scalar, rtol=1e-12, atol=1e-12)
+
+    def test_quotes_match_scalar(self):
+        client = MockBloombergClient()
+        today = date.today()
+        specs = [
+            (ul, today + timedelta(days=days), strike, opt)
+            for ul, strikes in (("AAPL", (150.0, 230.0, 300.0)), ("SPX", (4800.0, 5600.0)))
+            for strike in strikes
+            for days in (-5, 0, 30, 365)
+            for opt in ("call", "put")
+        ]
+        for spec, quote in zip(specs, client.get_option_quotes(specs)):
+            bid, offer = self._scalar_quote(client, *spec)
+            assert quote.bid == round(bid, 2), spec
+            assert quote.offer == round(offer, 2), spec
+
+    def test_quotes_are_two_sided(self):
+        for quote in MockBloombergClient().get_option_quotes(self._specs()):
+            assert 0 < quote.bid < quote.offer
+            assert quote.bid_size > 0 and quote.offer_size > 0
+
+    def test_itm_call_above_otm_put(self):
+        expiry = date.today() + timedelta(days=90)
+        call, put = MockBloombergClient().get_option_quotes([
+            ("AAPL", expiry, 200.0, "call"),
+            ("AAPL", expiry, 200.0, "put"),
+        ])
+        # Deep ITM call is worth far more than the OTM put at the same strike
+        assert call.bid > put.offer
+
+    def test_expired_option_near_intrinsic(self):
+        expiry = date.today() - timedelta(days=1)
+        (quote,) = MockBloombergClient().get_option_quotes([("AAPL", expiry, 200.0, "call")])
+        assert abs((quote.bid + quote.offer) / 2 - 50.30) < 2.0
+
+    def test_empty(self):
+        assert MockBloombergClient().get_option_quotes([]) == []
+
+    def test_leaves_global_random_state_alone(self):
+        state = random.getstate()
+        MockBloombergClient().get_option_quotes(self._specs())
+        assert random.getstate() == state
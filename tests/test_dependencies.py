@@ -0,0 +1,24 @@
+"""Tests for the shared API state in api.dependencies."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from api import dependencies
+
+
+def test_market_data_runs_off_the_default_executor(monkeypatch):
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mktdata")
+    monkeypatch.setattr(dependencies, "_market_data_pool", pool)
+
+    async def main():
+        market = await dependencies.run_market_data(lambda: threading.current_thread().name)
+        file_io = await asyncio.to_thread(lambda: threading.current_thread().name)
+        return market, file_io
+
+    try:
+        market, file_io = asyncio.run(main())
+    finally:
+        pool.shutdown()
+    assert market.startswith("mktdata")
+    assert not file_io.startswith("mktdata")
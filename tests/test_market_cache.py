@@ -0,0 +1,119 @@
+"""Tests for the TTL cache in front of the market data client."""
+
+from datetime import date
+
+from options_pricer.bloomberg import MockBloombergClient, OptionQuote
+from options_pricer.market_cache import (
+    MULTIPLIER_TTL,
+    QUOTE_TTL,
+    SPOT_TTL,
+    CachedMarketClient,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingClient:
+    """Minimal client that records every call it receives."""
+
+    source_name = "Counting"
+
+    def __init__(self, spot=100.0):
+        self.spot = spot
+        self.calls: list[tuple] = []
+
+    def get_spot(self, underlying):
+        self.calls.append(("spot", underlying))
+        return self.spot
+
+    def get_spots(self, underlyings):
+        self.calls.append(("spots", tuple(underlyings)))
+        return {ul: self.spot for ul in underlyings if self.spot is not None}
+
+    def get_contract_multiplier(self, underlying):
+        self.calls.append(("mult", underlying))
+        return 100
+
+    def get_option_quotes(self, specs):
+        self.calls.append(("quotes", tuple(specs)))
+        return [OptionQuote(bid=s[2] / 100, offer=s[2] / 100 + 0.1) for s in specs]
+
+
+EXP = date(2026, 6, 19)
+
+
+class TestSpotCache:
+    def test_hit_within_ttl(self):
+        client, clock = CountingClient(), FakeClock()
+        cached = CachedMarketClient(client, clock=clock)
+        assert cached.get_spot("AAPL") == 100.0
+        clock.now = SPOT_TTL / 2
+        assert cached.get_spot("AAPL") == 100.0
+        assert client.calls == [("spot", "AAPL")]
+
+    def test_refetch_after_ttl(self):
+        client, clock = CountingClient(), FakeClock()
+        cached = CachedMarketClient(client, clock=clock)
+        cached.get_spot("AAPL")
+        clock.now = SPOT_TTL
+        cached.get_spot("AAPL")
+        assert len(client.calls) == 2
+
+    def test_none_not_cached(self):
+        client = CountingClient(spot=None)
+        cached = CachedMarketClient(client, clock=FakeClock())
+        assert cached.get_spot("AAPL") is None
+        assert cached.get_spot("AAPL") is None
+        assert len(client.calls) == 2
+
+    def test_batch_fetches_only_misses(self):
+        client, clock = CountingClient(), FakeClock()
+        cached = CachedMarketClient(client, clock=clock)
+        cached.get_spot("AAPL")
+        assert cached.get_spots(["AAPL", "MSFT"]) == {"AAPL": 100.0, "MSFT": 100.0}
+        assert cached.get_spot("MSFT") == 100.0
+        assert client.calls == [("spot", "AAPL"), ("spots", ("MSFT",))]
+
+
+class TestMultiplierCache:
+    def test_cached_for_a_day(self):
+        client, clock = CountingClient(), FakeClock()
+        cached = CachedMarketClient(client, clock=clock)
+        cached.get_contract_multiplier("AAPL")
+        clock.now = MULTIPLIER_TTL - 1
+        assert cached.get_contract_multiplier("AAPL") == 100
+        assert client.calls == [("mult", "AAPL")]
+
+
+class TestQuoteCache:
+    def test_only_misses_are_fetched(self):
+        client, clock = CountingClient(), FakeClock()
+        cached = CachedMarketClient(client, clock=clock)
+        a = ("AAPL", EXP, 240.0, "put")
+        b = ("AAPL", EXP, 220.0, "put")
+        cached.get_option_quotes([a])
+        quotes = cached.get_option_quotes([a, b, a])
+        assert client.calls == [("quotes", (a,)), ("quotes", (b,))]
+        assert [q.bid for q in quotes] == [2.4, 2.2, 2.4]
+
+    def test_expiry(self):
+        client, clock = CountingClient(), FakeClock()
+        cached = CachedMarketClient(client, clock=clock)
+        spec = ("AAPL", EXP, 240.0, "put")
+        cached.get_option_quote(*spec)
+        clock.now = QUOTE_TTL
+        cached.get_option_quote(*spec)
+        assert len(client.calls) == 2
+
+
+class TestPassthrough:
+    def test_other_attributes_delegate(self):
+        cached = CachedMarketClient(MockBloombergClient())
+        assert cached.source_name == "Mock Data"
+        assert cached.get_risk_free_rate() == 0.05
@@ -1,8 +1,17 @@
 """Tests for data models."""
 
+from dataclasses import FrozenInstanceError
 from datetime import date
 
-from options_pricer.models import OptionLeg, OptionStructure, OptionType, Side
+import pytest
+
+from options_pricer.models import (
+    LegMarketData,
+    OptionLeg,
+    OptionStructure,
+    OptionType,
+    Side,
+)
 
 
 class TestOptionLeg:
@@ -78,6 +87,19 @@ class TestOptionStructure:
         s = self._make_call_spread()
         assert s.net_quantity == 0  # 1 buy - 1 sell
 
+    def test_base_quantity(self):
+        s = OptionStructure(
+            name="1x2 put spread",
+            legs=[
+                OptionLeg("AAPL", date(2025, 1, 16), 150.0, OptionType.PUT, Side.BUY, 500),
+                OptionLeg("AAPL", date(2025, 1, 16), 140.0, OptionType.PUT, Side.SELL, 1000),
+            ],
+        )
+        assert s.base_quantity == 500
+
+    def test_base_quantity_empty(self):
+        assert OptionStructure(name="empty").base_quantity == 1
+
     def test_call_spread_payoff_below(self):
         s = self._make_call_spread()
         assert s.total_payoff(140.0) == 0.0
@@ -108,3 +130,17 @@ class TestOptionStructure:
         assert len(points) == 4
         assert points[0] == (140.0, 0.0)
         assert points[-1] == (170.0, 10.0)
+
+
+class TestLegMarketData:
+    def test_mid_two_sided(self):
+        assert LegMarketData(bid=1.0, offer=1.5).mid == 1.25
+
+    def test_mid_one_sided(self):
+        assert LegMarketData(bid=1.0).mid == 1.0
+        assert LegMarketData(offer=2.0).mid == 2.0
+
+    def test_frozen(self):
+        mkt = LegMarketData()
+        with pytest.raises(FrozenInstanceError):
+            mkt.bid = 1.0
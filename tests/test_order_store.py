@@ -10,7 +10,10 @@ from options_pricer.order_store import (
     _file_lock,
     _orders_file_for_date,
     add_order,
+    apply_order_update,
     get_orders_mtime,
+    get_orders_stamp,
+    index_orders,
     list_order_dates,
     load_orders,
     orders_to_display,
@@ -64,6 +67,19 @@ class TestSaveOrders:
         data = json.loads(fp.read_text(encoding="utf-8"))
         assert len(data["orders"]) == 2
 
+    def test_non_json_values_stringified(self, tmp_path):
+        fp = tmp_path / "orders.json"
+        save_orders([{"id": "1", "expiry": date(2026, 3, 20), "legs": {1: "x"}}], fp)
+        data = json.loads(fp.read_text(encoding="utf-8"))
+        assert data["orders"][0]["expiry"] == "2026-03-20"
+        assert data["orders"][0]["legs"] == {"1": "x"}
+
+    def test_round_trip_unicode(self, tmp_path):
+        fp = tmp_path / "orders.json"
+        orders = [{"id": "1", "initiator": "Zoë", "pnl": "+1,250"}]
+        save_orders(orders, fp)
+        assert load_orders(fp) == orders
+
 
 class TestAddOrder:
     def test_adds_to_empty(self, tmp_path):
@@ -100,6 +116,51 @@ class TestUpdateOrder:
         # Original unchanged
         assert result[0]["traded"] == "No"
 
+    def test_post_hook_runs_before_save(self, tmp_path):
+        fp = tmp_path / "orders.json"
+        add_order({"id": "abc", "size": "10", "pnl": ""}, fp)
+
+        def hook(order):
+            order["pnl"] = f"size={order['size']}"
+
+        update_order("abc", {"size": "20"}, fp, post_hook=hook)
+        assert load_orders(fp)[0]["pnl"] == "size=20"
+
+
+class TestApplyOrderUpdate:
+    def test_updates_in_place(self):
+        orders = [{"id": "a", "traded": "No"}, {"id": "b", "traded": "No"}]
+        target = apply_order_update(orders, "b", {"traded": "Yes"})
+        assert target is orders[1]
+        assert orders[1]["traded"] == "Yes"
+        assert orders[0]["traded"] == "No"
+
+    def test_missing_id_returns_none(self):
+        orders = [{"id": "a"}]
+        assert apply_order_update(orders, "zzz", {"traded": "Yes"}) is None
+        assert orders == [{"id": "a"}]
+
+    def test_post_hook_receives_updated_order(self):
+        seen = []
+        apply_order_update([{"id": "a"}], "a", {"size": "5"}, post_hook=seen.append)
+        assert seen == [{"id": "a", "size": "5"}]
+
+
+class TestIndexOrders:
+    def test_maps_ids_to_orders(self):
+        orders = [{"id": "a", "size": "1"}, {"id": "b", "size": "2"}]
+        index = index_orders(orders)
+        assert set(index) == {"a", "b"}
+        assert index["b"]["size"] == "2"
+
+    def test_shares_dict_objects(self):
+        orders = [{"id": "a", "traded": "No"}]
+        index_orders(orders)["a"]["traded"] = "Yes"
+        assert orders[0]["traded"] == "Yes"
+
+    def test_skips_orders_without_id(self):
+        assert index_orders([{"underlying": "AAPL"}]) == {}
+
 
 class TestFileLock:
     def test_lock_acquire_release(self, tmp_path):
@@ -209,6 +270,22 @@ class TestGetOrdersMtime:
         assert mtime2 > mtime1
 
 
+class TestGetOrdersStamp:
+    def test_missing_file(self, tmp_path):
+        assert get_orders_stamp(tmp_path / "orders.json") == (0, 0)
+
+    def test_changes_with_size_even_if_mtime_matches(self, tmp_path):
+        import os
+        fp = tmp_path / "orders.json"
+        save_orders([], fp)
+        stamp1 = get_orders_stamp(fp)
+        save_orders([{"id": "1"}], fp)
+        os.utime(fp, ns=(stamp1[0], stamp1[0]))
+        stamp2 = get_orders_stamp(fp)
+        assert stamp2[0] == stamp1[0]
+        assert stamp2 != stamp1
+
+
 class TestOrdersFileForDate:
     def test_returns_path_for_today(self):
         path = _orders_file_for_date()
@@ -0,0 +1,185 @@
+"""Tests for the coalescing order writer and the routes that submit to it."""
+
+import asyncio
+import copy
+
+import orjson
+import pytest
+
+from api import order_writer as ow
+from api.routes.orders import update_order_fields
+from api.schemas import OrderUpdateRequest
+
+
+class _Store:
+    """In-memory stand-in for the orders file, counting saves."""
+
+    def __init__(self, orders):
+        self.orders = orders
+        self.saves = 0
+
+    def load(self, filepath=None):
+        return copy.deepcopy(self.orders)
+
+    def save(self, orders, filepath=None):
+        self.orders = copy.deepcopy(orders)
+        self.saves += 1
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = _Store([
+        {"id": "a", "underlying": "AAPL", "size": "10", "traded": "No"},
+        {"id": "b", "underlying": "MSFT", "size": "20", "traded": "No"},
+    ])
+    monkeypatch.setattr(ow, "load_orders", store.load)
+    monkeypatch.setattr(ow, "save_orders_locked", store.save)
+    monkeypatch.setattr(ow, "_live_prices", {})
+    monkeypatch.setattr(ow, "_orders_json_cache", None)
+    return store
+
+
+@pytest.fixture
+def frames(monkeypatch):
+    sent = []
+
+    async def broadcast(message, precomputed=None):
+        sent.append(precomputed)
+
+    # A connected client, so a real change would be broadcast
+    monkeypatch.setattr(ow.manager, "active", {object()})
+    monkeypatch.setattr(ow.manager, "broadcast", broadcast)
+    return sent
+
+
+def _run_with_writer(coro_fn):
+    async def main():
+        ow.order_writer.start()
+        try:
+            return await coro_fn()
+        finally:
+            await ow.order_writer.stop()
+
+    return asyncio.run(main())
+
+
+class TestBatchPatch:
+    def test_add_then_update_is_one_add(self):
+        patch = ow._BatchPatch()
+        order = {"id": "n", "size": "1"}
+        patch.merge({"added": [order]})
+        order["size"] = "2"
+        patch.merge({"updated": [order]})
+        assert patch.added == {"n": {"id": "n", "size": "2"}}
+        assert patch.updated == {}
+        assert patch.deleted == []
+
+    def test_add_then_delete_is_dropped(self):
+        patch = ow._BatchPatch()
+        patch.merge({"added": [{"id": "n"}]})
+        patch.merge({"deleted": ["n"]})
+        assert not patch
+
+    def test_update_then_delete_is_delete(self):
+        patch = ow._BatchPatch()
+        patch.merge({"updated": [{"id": "a", "size": "5"}]})
+        patch.merge({"deleted": ["a"]})
+        assert patch.updated == {}
+        assert patch.deleted == ["a"]
+
+    def test_encode_shape(self):
+        patch = ow._BatchPatch()
+        patch.merge({"added": [{"id": "n"}], "updated": [{"id": "a"}], "deleted": ["b"]})
+        assert orjson.loads(patch.encode()) == {
+            "added": [{"id": "n"}],
+            "updated": [{"id": "a"}],
+            "deleted": ["b"],
+        }
+
+
+class TestApply:
+    def test_failed_mutation_does_not_stop_batch(self, store, frames):
+        def bad(orders):
+            raise ValueError("boom")
+
+        def delete_b(orders):
+            return [o for o in orders if o["id"] != "b"], "ok", {"deleted": ["b"]}
+
+        async def main():
+            writer = ow.OrderWriter()
+            writer.committed = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            futs = [loop.create_future() for _ in range(2)]
+            await writer._apply([("update", bad, futs[0]), ("delete", delete_b, futs[1])])
+            return futs, writer.committed.is_set()
+
+        (bad_fut, ok_fut), committed = asyncio.run(main())
+        with pytest.raises(ValueError):
+            bad_fut.result()
+        result, orders_json = ok_fut.result()
+        assert result == "ok"
+        assert [o["id"] for o in orjson.loads(orders_json)["orders"]] == ["a"]
+        assert store.saves == 1
+        assert committed
+        assert len(frames) == 1
+        msg = orjson.loads(frames[0])
+        assert msg["channel"] == "order_sync"
+        assert msg["action"] == "delete"
+        assert msg["data"] == {"added": [], "updated": [], "deleted": ["b"]}
+
+
+class TestUpdateOrderFields:
+    def test_noop_edit_skips_save_and_broadcast(self, store, frames):
+        req = OrderUpdateRequest(size="10", traded="No")
+        _run_with_writer(lambda: update_order_fields("a", req))
+        assert store.saves == 0
+        assert frames == []
+
+    def test_edit_saves_and_broadcasts(self, store, frames):
+        req = OrderUpdateRequest(size="15")
+        _run_with_writer(lambda: update_order_fields("a", req))
+        assert store.saves == 1
+        assert store.orders[0]["size"] == "15"
+        assert len(frames) == 1
+
+    def test_duplicate_id_edits_and_returns_first_match(self, store, frames):
+        store.orders.append({"id": "a", "underlying": "AAPL", "size": "99", "traded": "No"})
+        resp = _run_with_writer(
+            lambda: update_order_fields("a", OrderUpdateRequest(size="15"))
+        )
+        assert orjson.loads(resp.body)["order"]["size"] == "15"
+        assert [o["size"] for o in store.orders] == ["15", "20", "99"]
+        assert orjson.loads(frames[0])["data"]["updated"][0]["size"] == "15"
+
+    def test_same_size_edits_refresh_cached_body(self, store, frames, monkeypatch):
+        # Saves that land in one mtime tick and keep the size share a stamp
+        monkeypatch.setattr(ow, "get_orders_stamp", lambda filepath=None: (1, 100))
+
+        async def edits():
+            await update_order_fields("a", OrderUpdateRequest(size="15"))
+            first = ow.cached_orders_json()
+            await update_order_fields("a", OrderUpdateRequest(size="16"))
+            return first, ow.cached_orders_json()
+
+        first, second = _run_with_writer(edits)
+        assert orjson.loads(first)["orders"][0]["size"] == "15"
+        assert orjson.loads(second)["orders"][0]["size"] == "16"
+
+
+class TestOrdersBodyCache:
+    def test_commit_during_load_is_not_cached_as_current(self, store, monkeypatch):
+        def load_then_commit(filepath=None):
+            orders = store.load()
+            # The writer saves while this read is still in flight
+            monkeypatch.setattr(ow, "_orders_version", ow._orders_version + 1)
+            return orders
+
+        monkeypatch.setattr(ow, "load_orders", load_then_commit)
+        body = ow.load_orders_json()
+        assert orjson.loads(body)["orders"][0]["id"] == "a"
+        assert ow.cached_orders_json() is None
+
+    def test_hit_skips_load(self, store, monkeypatch):
+        first = ow.load_orders_json()
+        monkeypatch.setattr(ow, "load_orders", None)
+        assert ow.load_orders_json() is first
@@ -0,0 +1,91 @@
+"""Tests for the WebSocket price loop helpers."""
+
+import asyncio
+import copy
+
+import orjson
+import pytest
+
+from api import order_writer as ow
+from api import ws as ws_mod
+from api.routes.orders import _recalc_pnl
+from api.ws import _recalc_pnls
+
+_BASE = {
+    "traded": "Yes", "bought_sold": "Bought", "traded_price": "2.50",
+    "mid": "3.10", "size": "100", "multiplier": 100, "pnl": "stale",
+}
+
+
+@pytest.mark.parametrize("fields", [
+    {},
+    {"bought_sold": "Sold"},
+    {"mid": "--"},
+    {"size": "ten"},
+    {"size": "1.5"},
+    {"multiplier": "100"},
+    {"multiplier": None},
+    {"traded": "No"},
+    {"traded_price": ""},
+    {"bought_sold": ""},
+    {"mid": "2.50"},
+    {"bought_sold": "Sold", "mid": "2.50"},
+])
+def test_batch_pnl_matches_scalar(fields):
+    order = {**_BASE, **fields}
+    expected = copy.deepcopy(order)
+    _recalc_pnl(expected)
+    # Twice: the second pass is served from the PnL string cache
+    for _ in range(2):
+        batch = [copy.deepcopy(order)]
+        _recalc_pnls(batch)
+        assert batch[0]["pnl"] == expected["pnl"]
+
+
+def test_sold_is_bought_negated():
+    bought = dict(_BASE)
+    sold = {**_BASE, "bought_sold": "Sold"}
+    _recalc_pnls([bought, sold])
+    assert bought["pnl"] == "+6,000"
+    assert sold["pnl"] == "-6,000"
+
+
+class _FakeSocket:
+    def __init__(self):
+        self.sent = []
+        self.joined_at_send = []
+
+    async def send_bytes(self, data):
+        self.sent.append(orjson.loads(data))
+        self.joined_at_send.append(self in ws_mod.manager.active)
+
+
+class TestJoinWithFullSync:
+    @pytest.fixture(autouse=True)
+    def _isolate(self, monkeypatch):
+        monkeypatch.setattr(ws_mod.manager, "active", set())
+        monkeypatch.setattr(ow, "_orders_json_cache", None)
+
+    def test_joins_after_full_sync(self, monkeypatch):
+        monkeypatch.setattr(ws_mod, "load_orders_json", lambda: b'{"orders":[]}')
+        sock = _FakeSocket()
+        asyncio.run(ws_mod._join_with_full_sync(sock))
+        assert [m["action"] for m in sock.sent] == ["full_sync"]
+        assert sock.joined_at_send == [False]
+        assert sock in ws_mod.manager.active
+
+    def test_resends_if_a_save_lands_during_load(self, monkeypatch):
+        bodies = iter([b'{"orders":[]}', b'{"orders":[{"id":"a"}]}'])
+
+        def load():
+            body = next(bodies)
+            if body == b'{"orders":[]}':
+                # The writer commits while this snapshot is being read
+                monkeypatch.setattr(ow, "_orders_version", ow._orders_version + 1)
+            return body
+
+        monkeypatch.setattr(ws_mod, "load_orders_json", load)
+        sock = _FakeSocket()
+        asyncio.run(ws_mod._join_with_full_sync(sock))
+        assert [m["data"]["orders"] for m in sock.sent] == [[], [{"id": "a"}]]
+        assert sock in ws_mod.manager.active